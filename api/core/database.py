@@ -37,11 +37,21 @@ class FormCheckDB:
         self.db_path = db_path or str(DB_PATH)
         self._init_db()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection with the per-connection write pragmas applied."""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+    
     def _init_db(self):
         """Initialize database schema."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
+        # WAL is persistent on the database file, so it only needs setting once
+        cursor.execute("PRAGMA journal_mode=WAL")
+        
         # Players table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS players (
@@ -108,7 +118,7 @@ class FormCheckDB:
                      working_on: str = None, limitations: str = None,
                      height_inches: int = None, email: str = None) -> int:
         """Create a new player."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -124,7 +134,7 @@ class FormCheckDB:
     
     def get_player(self, player_id: int) -> Optional[PlayerRecord]:
         """Get player by ID."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute("SELECT * FROM players WHERE id = ?", (player_id,))
@@ -143,7 +153,7 @@ class FormCheckDB:
     
     def list_players(self, limit: int = 10) -> List[PlayerRecord]:
         """List all players."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute("SELECT * FROM players ORDER BY updated_at DESC LIMIT ?", (limit,))
@@ -171,7 +181,7 @@ class FormCheckDB:
     
     def create_session(self, player_id: int, focus_area: str = None) -> int:
         """Create a new session."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -187,7 +197,7 @@ class FormCheckDB:
     
     def end_session(self, session_id: int, grade: str = None, summary: str = None):
         """End a session."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -201,46 +211,57 @@ class FormCheckDB:
     
     def record_shot(self, session_id: int, shot_data: Dict):
         """Record a shot."""
-        conn = sqlite3.connect(self.db_path)
+        self.record_shots(session_id, [shot_data])
+    
+    def record_shots(self, session_id: int, shots: List[Dict]):
+        """Record a batch of shots in a single transaction."""
+        if not shots:
+            return
+        
+        conn = self._connect()
         cursor = conn.cursor()
         
         # Get player_id from session
         cursor.execute("SELECT player_id FROM sessions WHERE id = ?", (session_id,))
         player_id = cursor.fetchone()[0]
         
-        # Convert list to JSON string
-        did_well_json = json.dumps(shot_data.get('did_well', [])) if shot_data.get('did_well') else None
-        
-        cursor.execute("""
+        rows = []
+        for shot_data in shots:
+            # Convert list to JSON string
+            did_well_json = json.dumps(shot_data.get('did_well', [])) if shot_data.get('did_well') else None
+            rows.append((
+                session_id, player_id, shot_data.get('shot_number'),
+                shot_data.get('made'), shot_data.get('miss_type'),
+                shot_data.get('elbow_angle_load'), shot_data.get('elbow_angle_release'),
+                shot_data.get('wrist_height_release'), shot_data.get('knee_bend_load'),
+                shot_data.get('form_rating'), shot_data.get('feedback'),
+                shot_data.get('key_issue'), shot_data.get('quick_cue'),
+                did_well_json, shot_data.get('looks_like')
+            ))
+        
+        cursor.executemany("""
             INSERT INTO shots (
                 session_id, player_id, shot_number, made, miss_type,
                 elbow_angle_load, elbow_angle_release, wrist_height_release, knee_bend_load,
                 form_rating, feedback, key_issue, quick_cue, did_well, looks_like
             ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            session_id, player_id, shot_data.get('shot_number'),
-            shot_data.get('made'), shot_data.get('miss_type'),
-            shot_data.get('elbow_angle_load'), shot_data.get('elbow_angle_release'),
-            shot_data.get('wrist_height_release'), shot_data.get('knee_bend_load'),
-            shot_data.get('form_rating'), shot_data.get('feedback'),
-            shot_data.get('key_issue'), shot_data.get('quick_cue'),
-            did_well_json, shot_data.get('looks_like')
-        ))
+        """, rows)
         
         # Update session shot count
+        makes = sum(1 for shot_data in shots if shot_data.get('made') == 1)
         cursor.execute("""
             UPDATE sessions 
-            SET shot_count = shot_count + 1,
-                make_count = make_count + CASE WHEN ? = 1 THEN 1 ELSE 0 END
+            SET shot_count = shot_count + ?,
+                make_count = make_count + ?
             WHERE id = ?
-        """, (shot_data.get('made', 0), session_id))
+        """, (len(shots), makes, session_id))
         
         conn.commit()
         conn.close()
     
     def update_player_stats(self, player_id: int):
         """Update player's total stats."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -256,7 +277,7 @@ class FormCheckDB:
     
     def get_player_patterns(self, player_id: int) -> Dict:
         """Get player's shooting patterns."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         # Get makes averages
@@ -335,7 +356,7 @@ class FormCheckDB:
     
     def get_recent_feedback(self, player_id: int, limit: int = 10) -> List[str]:
         """Get recent feedback given to player."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""
+FormCheck - Optional JIT
+
+Re-exports numba.njit when numba is installed. Without it, njit is a
+no-op decorator, so the decorated kernels run as plain Python.
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba isn't installed."""
+        def decorator(func):
+            return func
+        return decorator
@@ -10,18 +10,22 @@ Usage:
     python live_analysis.py --left video.mp4   # Left-handed mode
 """
 
+import asyncio
 import cv2
+import math
 import numpy as np
 import os
+import queue
+import re
 import sys
 import time
 import threading
 import urllib.request
-from collections import Counter
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional, Dict, List, Tuple
-import base64
 import json
 
 # Local imports
@@ -76,7 +80,6 @@ except ImportError:
 # Visual feedback system
 try:
     from visual_feedback import (
-        FrameAnnotator,
         ComparisonGenerator,
         LiveFeedbackOverlay,
         ShotBreakdown,
@@ -88,12 +91,34 @@ except ImportError:
     VISUAL_FEEDBACK_AVAILABLE = False
     print("⚠️  Visual feedback module not found - using basic display")
 
+# Optional PyAV for (hardware) video decode; falls back to cv2.VideoCapture
+try:
+    import av
+    AV_AVAILABLE = True
+except ImportError:
+    AV_AVAILABLE = False
+
+# Optional JIT for the per-frame geometry kernels (plain Python without numba)
+from jit import njit
+
 # ============================================================================
 # Configuration
 # ============================================================================
 
 GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY", "")
 GEMINI_MODEL = "gemini-2.0-flash"  # Fast model for real-time
+GEMINI_MAX_PENDING = 3  # Shots waiting for Gemini before falling back to local feedback
+DETECT_WIDTH = 640  # Working width for ball detection (pose and rim use the full frame)
+TRACKER_HZ = 20  # Ball trajectory sample rate for make/miss tracking
+RIM_ROI_PX = 200  # Within this vertical distance of the rim, sample every frame
+RIM_REDETECT_SECONDS = 1.0  # The rim is static - re-detect this often and reuse the bbox
+DEBUG_JPEG_PARAMS = [cv2.IMWRITE_JPEG_QUALITY, 80, cv2.IMWRITE_JPEG_OPTIMIZE, 0]
+GEMINI_JPEG_PARAMS = [cv2.IMWRITE_JPEG_QUALITY, 85]  # Shot frames sent to Gemini
+KEPT_FRAME_WIDTH = 640  # last_shot_frames are downscaled to this once the shot is rendered
+
+# key_issue keyword -> body part highlighted in the shot breakdown (one group per part, in priority order)
+_BODY_PART_RE = re.compile(r'(elbow)|(release|wrist)|(knee|leg)', re.IGNORECASE)
+_BODY_PARTS = ('elbow', 'release', 'knee')
 
 # ============================================================================
 # Data Classes
@@ -105,11 +130,14 @@ class ShotEvent:
     shot_number: int
     timestamp: float
     # Multiple frames capturing the full shot motion
-    frames: List[Tuple[str, np.ndarray]]  # List of (label, frame)
+    frames: Optional[List[Tuple[str, np.ndarray]]]  # List of (label, frame); released after visualization
     elbow_angle_load: float
     elbow_angle_release: float
     wrist_height_release: float = 0.0
     knee_bend_load: float = 0.0
+    # Pose landmarks for each entry in frames (already computed during capture)
+    frame_landmarks: List[Dict] = field(default_factory=list)
+    frame_index: Optional[int] = None  # Source video frame of the release, when known
     # Filled in by Gemini
     made: Optional[bool] = None
     miss_type: Optional[str] = None  # "short-left", "long-right", etc.
@@ -203,6 +231,11 @@ class LiveState:
     shot_metrics: List[ShotMetrics] = field(default_factory=list)
     all_feedback_given: List[str] = field(default_factory=list)
     
+    # Column views of shot_history for the session summary (0 = no rating)
+    form_ratings: np.ndarray = field(default_factory=lambda: np.zeros(64, dtype=np.float32))
+    miss_types: List[str] = field(default_factory=list)
+    quick_cues: List[str] = field(default_factory=list)
+    
     # Visual feedback storage
     last_shot_frames: List[Tuple[str, np.ndarray]] = field(default_factory=list)
     last_shot_landmarks: List[Dict] = field(default_factory=list)
@@ -211,6 +244,19 @@ class LiveState:
     last_shot_annotated: Optional[np.ndarray] = None
     show_last_shot: bool = False  # Toggle with 'v' key
     
+    def add_shot_record(self, record: dict):
+        """Append a history record and update the summary columns."""
+        n = len(self.shot_history)
+        if n == len(self.form_ratings):
+            self.form_ratings = np.resize(self.form_ratings, n * 2)
+        self.form_ratings[n] = record.get('form_rating') or 0
+        self.shot_history.append(record)
+        
+        if record.get('miss_type'):
+            self.miss_types.append(record['miss_type'])
+        if record.get('quick_cue'):
+            self.quick_cues.append(record['quick_cue'])
+    
     def get_make_miss_patterns(self) -> dict:
         """Analyze patterns in makes vs misses."""
         makes = [s for s in self.shot_metrics if s.made == True]
@@ -270,6 +316,16 @@ class GeminiClient:
         if db and player_id:
             self._load_historical_data()
         
+        # Shots are analyzed one at a time on a background event loop; the
+        # bounded queue caps in-flight requests (and the frames they hold)
+        self._model = None
+        self._loop = None
+        self._queue = None
+        if self.enabled:
+            ready = threading.Event()
+            threading.Thread(target=self._run_loop, args=(ready,), daemon=True).start()
+            ready.wait()
+        
         if not self.enabled:
             print("⚠️  GEMINI_API_KEY not set - feedback disabled")
             print("   Set it with: export GEMINI_API_KEY='your-key'")
@@ -294,12 +350,48 @@ class GeminiClient:
             callback(shot)
             return
         
-        thread = threading.Thread(
-            target=self._analyze, 
-            args=(shot, state, callback, local_analysis)
+        self._loop.call_soon_threadsafe(
+            self._enqueue, (shot, state, callback, local_analysis)
         )
-        thread.daemon = True
-        thread.start()
+    
+    def _run_loop(self, ready: threading.Event):
+        """Own the asyncio loop that serves queued shot analyses."""
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._queue = asyncio.Queue(maxsize=GEMINI_MAX_PENDING)
+        self._loop.create_task(self._worker())
+        ready.set()
+        self._loop.run_forever()
+    
+    def _enqueue(self, job: tuple):
+        """Queue a shot for Gemini, or answer locally if too many are pending."""
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            shot, state, callback, local_analysis = job
+            print(f"⚠️  Gemini busy - shot #{shot.shot_number} analyzed locally")
+            self._local_feedback(shot, local_analysis)
+            shot.processing = False
+            callback(shot)
+    
+    async def _worker(self):
+        """Analyze queued shots one at a time."""
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._analyze(*job)
+            finally:
+                self._queue.task_done()
+    
+    def _local_feedback(self, shot: ShotEvent, local_analysis: Dict = None):
+        """Fill in feedback from the local biomechanics check only."""
+        elbow = (local_analysis or {}).get("vs_research", {}).get("elbow")
+        if elbow == "below_optimal":
+            shot.feedback = f"Elbow at {shot.elbow_angle_load:.0f}° - get under it, aim for 85-95°"
+        elif elbow == "above_optimal":
+            shot.feedback = f"Elbow at {shot.elbow_angle_load:.0f}° - tuck it in, aim for 85-95°"
+        else:
+            shot.feedback = "Keep shooting!"
     
     def _build_prompt(self, shot: ShotEvent, state: LiveState, 
                       local_analysis: Dict = None) -> str:
@@ -507,34 +599,40 @@ Respond in JSON:
 """
         return prompt
     
-    def _analyze(self, shot: ShotEvent, state: LiveState, callback, 
-                 local_analysis: Dict = None):
+    def _build_content(self, shot: ShotEvent, state: LiveState,
+                       local_analysis: Dict = None) -> list:
+        """Encode the shot frames and prompt into a Gemini request."""
+        # Encode all frames as raw JPEG bytes (the SDK base64-encodes on the wire)
+        frames_data = []
+        for label, frame in shot.frames:
+            _, buffer = cv2.imencode('.jpg', frame, GEMINI_JPEG_PARAMS)
+            frames_data.append({"label": label, "data": buffer.tobytes()})
+        
+        # Build prompt (include local analysis if available)
+        prompt = self._build_prompt(shot, state, local_analysis)
+        
+        # Build content with images
+        content = [prompt]
+        for fd in frames_data:
+            content.append({
+                "mime_type": "image/jpeg",
+                "data": fd["data"]
+            })
+        return content
+    
+    async def _analyze(self, shot: ShotEvent, state: LiveState, callback, 
+                       local_analysis: Dict = None):
         """Send frames to Gemini and get feedback."""
         try:
             import google.generativeai as genai
             
-            genai.configure(api_key=self.api_key)
-            model = genai.GenerativeModel(GEMINI_MODEL)
+            if self._model is None:
+                genai.configure(api_key=self.api_key)
+                self._model = genai.GenerativeModel(GEMINI_MODEL)
             
-            # Encode all frames as base64
-            frames_data = []
-            for label, frame in shot.frames:
-                _, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 85])
-                b64 = base64.b64encode(buffer).decode('utf-8')
-                frames_data.append({"label": label, "data": b64})
-            
-            # Build prompt (include local analysis if available)
-            prompt = self._build_prompt(shot, state, local_analysis)
-            
-            # Build content with images
-            content = [prompt]
-            for fd in frames_data:
-                content.append({
-                    "mime_type": "image/jpeg",
-                    "data": fd["data"]
-                })
-            
-            response = model.generate_content(content)
+            # JPEG encoding is CPU work - keep it off the event loop
+            content = await asyncio.to_thread(self._build_content, shot, state, local_analysis)
+            response = await self._model.generate_content_async(content)
             
             # Parse response
             text = response.text.strip()
@@ -711,6 +809,169 @@ Respond in this exact JSON format:
                 "drill": ""
             }
 
+# ============================================================================
+# Video Input
+# ============================================================================
+
+def _hwaccel_device() -> Optional[str]:
+    """Pick the FFmpeg hardware decode device for this machine (VIDEO_HWACCEL overrides)."""
+    device = os.environ.get("VIDEO_HWACCEL", "auto")
+    if device != "auto":
+        return device or None
+    if sys.platform == "darwin":
+        return "videotoolbox"
+    if os.path.exists("/dev/nvidia0"):
+        return "cuda"  # NVDEC
+    if os.path.exists("/dev/dri/renderD128"):
+        return "vaapi"
+    return None
+
+
+def _open_av(video_path: str):
+    """Open a video with PyAV, using hardware decode when this PyAV supports it."""
+    device = _hwaccel_device()
+    if device:
+        try:
+            from av.codec.hwaccel import HWAccel
+            return av.open(video_path, hwaccel=HWAccel(device_type=device,
+                                                       allow_software_fallback=True))
+        except (ImportError, TypeError):
+            pass  # PyAV < 14 has no hwaccel support
+    return av.open(video_path)
+
+
+def probe_video(video_path: str) -> Optional[Tuple[float, int]]:
+    """Return (fps, frame_count) for a video, or None if it can't be opened.
+    
+    frame_count may be an estimate; decoders read to EOF regardless.
+    """
+    if AV_AVAILABLE:
+        try:
+            with av.open(video_path) as container:
+                stream = container.streams.video[0]
+                fps = float(stream.average_rate or 0) or 30
+                frames = stream.frames
+                if not frames:
+                    # Many containers (webm/mkv, some mov) don't record a
+                    # frame count - estimate it from the duration
+                    if stream.duration and stream.time_base:
+                        frames = int(stream.duration * stream.time_base * fps)
+                    elif container.duration:
+                        frames = int(container.duration / av.time_base * fps)
+                if frames:
+                    return fps, frames
+        except Exception:
+            pass
+    
+    # No PyAV, or no usable frame count from it
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        return None
+    fps = cap.get(cv2.CAP_PROP_FPS) or 30
+    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    cap.release()
+    return fps, total_frames
+
+
+def decode_frames(video_path: str, stride: int = 1, start: int = 0,
+                  end: Optional[int] = None):
+    """
+    Yield (frame_index, bgr_frame) for every stride-th frame of a video.
+    
+    Frame indices are 1-based source frame numbers; only frames at 0-based
+    positions [start, end) are read. PyAV (with hardware decode where
+    available) is used when installed; otherwise - or when seeking to a
+    start frame, which OpenCV positions exactly - cv2.VideoCapture, which
+    grab()s skipped frames without decoding them.
+    """
+    stride = max(1, stride)
+    
+    container = None
+    if AV_AVAILABLE and not start:
+        try:
+            container = _open_av(video_path)
+        except Exception as e:
+            print(f"⚠️  PyAV could not open video ({e}) - using OpenCV")
+    
+    if container is not None:
+        with container:
+            stream = container.streams.video[0]
+            stream.thread_type = "AUTO"
+            for idx, frame in enumerate(container.decode(stream), 1):
+                if end is not None and idx > end:
+                    break
+                # Inter-frame codecs decode every frame; skip the conversion
+                if idx % stride == 0:
+                    yield idx, frame.to_ndarray(format="bgr24")
+        return
+    
+    cap = cv2.VideoCapture(video_path)
+    try:
+        if start:
+            cap.set(cv2.CAP_PROP_POS_FRAMES, start)
+        idx = start
+        while (end is None or idx < end) and cap.grab():
+            idx += 1
+            if idx % stride:
+                continue
+            ret, frame = cap.retrieve()
+            if not ret:
+                break
+            yield idx, frame
+    finally:
+        cap.release()
+
+
+class FrameProducer:
+    """
+    Decodes a video on a background thread so pose inference on the
+    consumer's thread overlaps with decode (both release the GIL).
+    
+    `frames` is an iterator of (frame_index, frame), e.g. decode_frames().
+    Items are passed through on `queue`; None marks the end of the video.
+    """
+    
+    def __init__(self, frames, maxsize: int = 32):
+        self.frames = frames
+        self.queue = queue.Queue(maxsize=maxsize)
+        self.started = False
+        self._thread = None
+    
+    def start(self) -> "FrameProducer":
+        self.started = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        """Stop decoding (e.g. when the consumer bails out early)."""
+        self.started = False
+        if self._thread:
+            self._thread.join()
+    
+    def _put(self, item) -> bool:
+        # Time out periodically so stop() is never stuck behind a full queue
+        while self.started:
+            try:
+                self.queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def _run(self):
+        try:
+            for item in self.frames:
+                if not self._put(item):
+                    break
+        except Exception as e:
+            print(f"⚠️  Video decode stopped: {e}")
+        finally:
+            close = getattr(self.frames, "close", None)
+            if close:
+                close()  # Releases the decoder if we stopped early
+            self._put(None)
+
 # ============================================================================
 # Pose and Ball Detection
 # ============================================================================
@@ -743,7 +1004,15 @@ def download_model():
         sys.exit(1)
 
 class PoseDetector:
-    """MediaPipe Tasks API pose detection."""
+    """
+    MediaPipe Tasks API pose detection.
+    
+    Configured for continuous video: VIDEO running mode tracks landmarks
+    between frames and only re-runs the person detector when tracking is
+    lost (the Tasks equivalent of static_image_mode=False), and the
+    BlazePose Lite model (~5.3 MB, model_complexity=0) keeps per-frame
+    cost low without hurting the elbow/knee angles we measure.
+    """
     
     def __init__(self):
         download_model()
@@ -755,17 +1024,36 @@ class PoseDetector:
         base_options = python.BaseOptions(model_asset_path=MODEL_PATH)
         options = vision.PoseLandmarkerOptions(
             base_options=base_options,
-            running_mode=vision.RunningMode.VIDEO,
+            running_mode=vision.RunningMode.VIDEO,  # Track between frames
             num_poses=1,
             min_pose_detection_confidence=0.5,
             min_pose_presence_confidence=0.5,
-            min_tracking_confidence=0.5,
+            min_tracking_confidence=0.5,  # Stay on tracking instead of re-detecting mid-shot
+            output_segmentation_masks=False,  # Segmentation head is unused here
         )
         self.detector = vision.PoseLandmarker.create_from_options(options)
         self.frame_count = 0
+        self._ts_offset = 0
+        self._last_ts = 0
+        self._executor = None  # Worker thread for detect_async
+    
+    def reset(self):
+        """
+        Start a new video on a reused detector.
+        
+        VIDEO mode requires increasing timestamps, so the next video continues
+        after the last one (with a gap so tracking restarts) instead of at 0.
+        """
+        self._ts_offset = self._last_ts + 1000
+        self.frame_count = 0
     
-    def detect(self, frame: np.ndarray) -> Tuple[Dict, Dict]:
-        """Returns (landmarks, visibility) dicts."""
+    def detect(self, frame: np.ndarray,
+               timestamp_ms: Optional[int] = None) -> Tuple[Dict, Dict]:
+        """Returns (landmarks, visibility) dicts.
+        
+        timestamp_ms: Source timestamp, for callers that skip frames
+        (defaults to consecutive ~30fps frames)
+        """
         import mediapipe as mp
         
         # Convert to RGB
@@ -774,7 +1062,10 @@ class PoseDetector:
         
         # Detect with timestamp
         self.frame_count += 1
-        timestamp_ms = int(self.frame_count * 33.33)  # Assume ~30fps
+        if timestamp_ms is None:
+            timestamp_ms = int(self.frame_count * 33.33)  # Assume ~30fps
+        timestamp_ms += self._ts_offset
+        self._last_ts = timestamp_ms
         
         try:
             results = self.detector.detect_for_video(mp_image, timestamp_ms)
@@ -794,11 +1085,52 @@ class PoseDetector:
         
         return landmarks, visibility
     
+    def detect_async(self, frame: np.ndarray,
+                     timestamp_ms: Optional[int] = None) -> Future:
+        """
+        Run detect() on this detector's worker thread; returns a Future.
+        
+        A single worker keeps calls in submission order, as VIDEO mode needs.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        return self._executor.submit(self.detect, frame, timestamp_ms)
+    
     def close(self):
         """Clean up detector."""
+        if self._executor is not None:
+            self._executor.shutdown()
         if hasattr(self, 'detector'):
             self.detector.close()
 
+
+def detect_poses(pose: PoseDetector, frames, fps: float, max_width: Optional[int] = None):
+    """
+    Yield (frame_index, frame, landmarks, visibility) for (frame_index, frame) items.
+    
+    Detection runs one frame ahead on the detector's worker thread (MediaPipe
+    releases the GIL), so the caller's per-frame work overlaps the next
+    inference. Frames wider than max_width are downscaled for detection only;
+    landmarks are normalized so they apply to the full frame.
+    """
+    pending = None
+    for idx, frame in frames:
+        small = frame
+        if max_width and frame.shape[1] > max_width:
+            scale = max_width / frame.shape[1]
+            small = cv2.resize(frame, None, fx=scale, fy=scale,
+                               interpolation=cv2.INTER_AREA)
+        future = pose.detect_async(small, int(idx * 1000 / fps))
+        
+        if pending:
+            p_idx, p_frame, p_future = pending
+            yield (p_idx, p_frame, *p_future.result())
+        pending = (idx, frame, future)
+    
+    if pending:
+        p_idx, p_frame, p_future = pending
+        yield (p_idx, p_frame, *p_future.result())
+
 class BallDetector:
     """YOLO-based ball detection."""
     
@@ -813,8 +1145,14 @@ class BallDetector:
             self.enabled = False
             print("⚠️  YOLOv8 not available - ball tracking disabled")
     
-    def detect(self, frame: np.ndarray, wrist_pos: Optional[Tuple[int, int]] = None) -> Optional[Tuple[int, int, int]]:
-        """Returns (center_x, center_y, radius) or None."""
+    def detect(self, frame: np.ndarray, wrist_pos: Optional[Tuple[int, int]] = None,
+               coord_scale: float = 1.0) -> Optional[Tuple[int, int, int]]:
+        """
+        Returns (center_x, center_y, radius) or None.
+        
+        If frame is a downscaled copy, coord_scale is its size relative to the
+        original; wrist_pos and the result are in original-frame pixels.
+        """
         if not self.enabled:
             return None
         
@@ -828,7 +1166,7 @@ class BallDetector:
                 continue
             for i in range(len(result.boxes)):
                 conf = float(result.boxes.conf[i])
-                x1, y1, x2, y2 = result.boxes.xyxy[i].tolist()
+                x1, y1, x2, y2 = (v / coord_scale for v in result.boxes.xyxy[i].tolist())
                 cx, cy = int((x1+x2)/2), int((y1+y2)/2)
                 radius = int(max(x2-x1, y2-y1)/2)
                 
@@ -850,6 +1188,16 @@ class BallDetector:
 # Shot Detector
 # ============================================================================
 
+@njit(cache=True, fastmath=True)
+def _joint_angle(ax: float, ay: float, bx: float, by: float,
+                 cx: float, cy: float) -> float:
+    """Angle in degrees at (bx, by) between the rays to (ax, ay) and (cx, cy)."""
+    v1x, v1y = ax - bx, ay - by
+    v2x, v2y = cx - bx, cy - by
+    cross = v1x * v2y - v1y * v2x
+    dot = v1x * v2x + v1y * v2y
+    return math.degrees(abs(math.atan2(cross, dot)))
+
 class LiveShotDetector:
     """
     Detects shots using release-backward approach.
@@ -860,30 +1208,44 @@ class LiveShotDetector:
     3. Capture more frames between load and release (the actual shooting motion)
     """
     
-    def __init__(self, shooting_side: str = "right"):
+    def __init__(self, shooting_side: str = "right", frame_stride: int = 1):
+        """
+        frame_stride: Source frames per update() call. Frame counts below are
+        tuned for every frame of ~30fps video and are scaled down to match.
+        """
         self.side = shooting_side
+        self.frame_stride = max(1, frame_stride)
+        
+        def frames(n: int) -> int:
+            return max(1, round(n / self.frame_stride))
         
         # Buffers
         self.frames_buffer = []
         self.landmarks_buffer = []
         self.elbow_angles = []
         self.wrist_heights = []
-        self.max_buffer = 180
+        self.max_buffer = frames(180)
         
         # Detection state
         self.stability_count = 0
-        self.STABILITY_REQUIRED = 8
+        self.STABILITY_REQUIRED = frames(8)
         
         # Thresholds
         self.RELEASE_ANGLE = 155  # Triggers shot detection
-        self.MIN_SHOT_FRAMES = 10
+        self.MIN_SHOT_FRAMES = frames(10)
+        self.LOAD_SEARCH_FRAMES = frames(60)  # How far back from release to look for load
+        self.EDGE_FRAMES = frames(5)  # Stance before load / follow-through after release
         
         # Cooldown
         self.last_shot_frame = -100
-        self.COOLDOWN_FRAMES = 45
+        self.COOLDOWN_FRAMES = frames(45)
     
-    def update(self, frame: np.ndarray, landmarks: Dict, visibility: Dict) -> Optional[ShotEvent]:
-        """Process frame and return ShotEvent if shot detected."""
+    def update(self, frame: np.ndarray, landmarks: Dict, visibility: Dict,
+               frame_index: Optional[int] = None) -> Optional[ShotEvent]:
+        """Process frame and return ShotEvent if shot detected.
+        
+        frame_index: Source video frame number, recorded on the ShotEvent
+        """
         
         # Extract key points
         shoulder = landmarks.get(f"{self.side}_shoulder")
@@ -930,6 +1292,7 @@ class LiveShotDetector:
         if elbow_angle and elbow_angle > self.RELEASE_ANGLE and wrist_above_shoulder:
             shot = self._create_shot_from_release(current_idx)
             if shot:
+                shot.frame_index = frame_index
                 self.last_shot_frame = current_idx
                 return shot
         
@@ -937,10 +1300,7 @@ class LiveShotDetector:
     
     def _calculate_angle(self, p1, p2, p3) -> float:
         """Calculate angle at p2."""
-        v1 = np.array([p1[0] - p2[0], p1[1] - p2[1]])
-        v2 = np.array([p3[0] - p2[0], p3[1] - p2[1]])
-        cos_angle = np.dot(v1, v2) / (np.linalg.norm(v1) * np.linalg.norm(v2) + 1e-6)
-        return np.degrees(np.arccos(np.clip(cos_angle, -1, 1)))
+        return _joint_angle(p1[0], p1[1], p2[0], p2[1], p3[0], p3[1])
     
     def _create_shot_from_release(self, release_idx: int) -> Optional[ShotEvent]:
         """
@@ -954,7 +1314,7 @@ class LiveShotDetector:
         - FollowThrough: 5 frames after release
         """
         # Search backward for LOAD (minimum elbow angle)
-        search_start = max(0, release_idx - 60)
+        search_start = max(0, release_idx - self.LOAD_SEARCH_FRAMES)
         
         load_idx = release_idx
         min_angle = float('inf')
@@ -977,10 +1337,10 @@ class LiveShotDetector:
         mid4_idx = load_idx + int(shot_duration * 0.80)
         
         # Stance: 5 frames before load
-        stance_idx = max(0, load_idx - 5)
+        stance_idx = max(0, load_idx - self.EDGE_FRAMES)
         
         # Follow-through: 5 frames after release (reduced from 12)
-        followthrough_idx = min(release_idx + 5, len(self.frames_buffer) - 1)
+        followthrough_idx = min(release_idx + self.EDGE_FRAMES, len(self.frames_buffer) - 1)
         
         # Clamp all indices
         def clamp(i):
@@ -1006,6 +1366,11 @@ class LiveShotDetector:
             ("7_Release", self.frames_buffer[release_idx]),
             ("8_FollowThrough", self.frames_buffer[followthrough_idx]),
         ]
+        frame_landmarks = [
+            self.landmarks_buffer[i]
+            for i in (stance_idx, load_idx, mid1_idx, mid2_idx, mid3_idx,
+                      mid4_idx, release_idx, followthrough_idx)
+        ]
         
         # Debug output
         release_angle = self.elbow_angles[release_idx] if release_idx < len(self.elbow_angles) else 0
@@ -1025,6 +1390,7 @@ class LiveShotDetector:
             shot_number=0,
             timestamp=time.time(),
             frames=frames,
+            frame_landmarks=frame_landmarks,
             elbow_angle_load=min_angle,
             elbow_angle_release=release_angle or 170,
             wrist_height_release=wrist_height,
@@ -1074,6 +1440,33 @@ class LiveShotDetector:
             return self.elbow_angles[-1]
         return None
 
+
+def detect_shots_in_range(video_path: str, start: int, end: Optional[int],
+                          shooting_side: str = "right", stride: int = 1,
+                          fps: float = 30.0, warmup: int = 0,
+                          pose_width: Optional[int] = None) -> List[ShotEvent]:
+    """
+    Detect the shots released within source frames [start, end) of a video.
+    
+    Top-level so a process pool can scan one range per worker, each with its
+    own PoseDetector. Scanning begins `warmup` frames early to prime the
+    detector's history (stability, load search, cooldown); shots released
+    before `start` are dropped since the previous range reports them.
+    Frames wider than pose_width are downscaled for pose detection only.
+    """
+    pose = PoseDetector()
+    detector = LiveShotDetector(shooting_side, frame_stride=stride)
+    shots = []
+    try:
+        frames = decode_frames(video_path, stride, max(0, start - warmup), end)
+        for idx, frame, landmarks, visibility in detect_poses(pose, frames, fps, pose_width):
+            shot = detector.update(frame, landmarks, visibility, frame_index=idx)
+            if shot and shot.frame_index > start:
+                shots.append(shot)
+    finally:
+        pose.close()
+    return shots
+
 # ============================================================================
 # Visualization
 # ============================================================================
@@ -1418,6 +1811,42 @@ class LiveAnalyzer:
             self.make_miss_tracker = MakeMissTracker(self.rim_detector)
             print("✓ Rim detection enabled for make/miss tracking")
         
+        # OpenCV T-API: hand rim detection a UMat so its cv2 ops can run on the
+        # GPU when a device is available (_detect_rim falls back if it can't)
+        self._use_opencl = False
+        if self.rim_detector and cv2.ocl.haveOpenCL():
+            cv2.ocl.setUseOpenCL(True)
+            self._use_opencl = cv2.ocl.useOpenCL()
+            if self._use_opencl:
+                print("✓ OpenCL enabled for rim detection")
+        
+        # Pose, ball and rim inference are independent per frame, so run them
+        # concurrently (the TFLite / YOLO calls release the GIL)
+        self._infer_pool = ThreadPoolExecutor(max_workers=3)
+        
+        # Shot annotation, DB writes and debug dumps run as (handler, shot) jobs
+        # on their own worker so the capture loop and Gemini callback only enqueue
+        self._pending_shot_records = deque()
+        self._viz_queue = queue.Queue()
+        self._viz_thread = threading.Thread(target=self._viz_worker, daemon=True)
+        self._viz_thread.start()
+        
+        # Shared shot annotator (its .annotator is visual_feedback's module-wide one)
+        self._comparison = ComparisonGenerator() if VISUAL_FEEDBACK_AVAILABLE else None
+        
+        # Height never changes during a session, so resolve its profile once
+        self._cached_height_profile = None
+        self._height_profile_dict = None
+        if BIOMECHANICS_AVAILABLE and self.player_profile.height_inches:
+            hp = get_height_profile(self.player_profile.height_inches)
+            self._cached_height_profile = hp
+            self._height_profile_dict = {
+                "category": hp.category,
+                "release_speed": hp.release_speed,
+                "arc_emphasis": hp.arc_emphasis,
+                "key_principles": hp.key_principles,
+            }
+        
         self.state = LiveState()
         self.frame_count = 0
         
@@ -1459,11 +1888,11 @@ class LiveAnalyzer:
             "quick_cue": shot.quick_cue,
             "looks_like": shot.looks_like
         }
-        self.state.shot_history.append(shot_record)
+        self.state.add_shot_record(shot_record)
         
-        # Record to database
+        # Buffer for the database (flushed in batches by the worker)
         if self.db and self.session_id:
-            self.db.record_shot(self.session_id, {
+            self._pending_shot_records.append({
                 "shot_number": shot.shot_number,
                 "made": shot.made,
                 "miss_type": shot.miss_type,
@@ -1484,9 +1913,8 @@ class LiveAnalyzer:
             self.state.feedback_display_until = time.time() + 5.0
             self.state.all_feedback_given.append(shot.feedback)
         
-        # Generate annotated visual feedback
-        if VISUAL_FEEDBACK_AVAILABLE and shot.frames:
-            self._generate_shot_visualization(shot)
+        # Flush DB records and generate annotated visual feedback on the worker
+        self._viz_queue.put((self._process_analyzed_shot, shot))
         
         # Print results with enhanced formatting
         if shot.made:
@@ -1513,20 +1941,46 @@ class LiveAnalyzer:
             print(f"  → Fix: {shot.key_issue}")
         
         print("  📸 Press 'v' to view annotated shot breakdown")
-        
-        # Auto-show the annotated shot window if enabled
-        if hasattr(self, 'auto_show_analysis') and self.auto_show_analysis:
-            if self.state.last_shot_annotated is not None:
-                self.state.show_last_shot = True
-        
         print()
     
+    def _viz_worker(self):
+        """Run queued shot jobs off the capture and callback threads."""
+        while True:
+            job = self._viz_queue.get()
+            if job is None:
+                break
+            handler, shot = job
+            handler(shot)
+    
+    def _process_analyzed_shot(self, shot: ShotEvent):
+        """Persist buffered shot records and build the annotated view."""
+        self._flush_shot_records()
+        if VISUAL_FEEDBACK_AVAILABLE and shot.frames:
+            self._generate_shot_visualization(shot)
+    
+    def _save_debug_frames(self, shot: ShotEvent):
+        """Write the frames sent to Gemini to debug_frames/shot_N/."""
+        shot_dir = Path("debug_frames") / f"shot_{shot.shot_number}"
+        shot_dir.mkdir(parents=True, exist_ok=True)
+        
+        for i, (label, frame_img) in enumerate(shot.frames):
+            ok, buf = cv2.imencode('.jpg', frame_img, DEBUG_JPEG_PARAMS)
+            if ok:
+                filename = shot_dir / f"{i}_{label.replace(' ', '_')}.jpg"
+                filename.write_bytes(buf.tobytes())
+        print(f"   ✓ Debug frames saved to {shot_dir}/")
+    
+    def _flush_shot_records(self):
+        """Write all buffered shot records to the database in one batch."""
+        records = []
+        while self._pending_shot_records:
+            records.append(self._pending_shot_records.popleft())
+        if records:
+            self.db.record_shots(self.session_id, records)
+    
     def _generate_shot_visualization(self, shot: ShotEvent):
         """Generate annotated visualization of the shot."""
         try:
-            # Store frames and create annotated version
-            self.state.last_shot_frames = shot.frames.copy() if shot.frames else []
-            
             # Get metrics dict
             metrics = {
                 "elbow_load": shot.elbow_angle_load,
@@ -1542,16 +1996,9 @@ class LiveAnalyzer:
             # Build issues list from feedback
             issues = []
             if shot.key_issue and shot.key_issue.lower() != "none":
-                # Determine which body part
-                issue_lower = shot.key_issue.lower()
-                if "elbow" in issue_lower:
-                    body_part = "elbow"
-                elif "release" in issue_lower or "wrist" in issue_lower:
-                    body_part = "release"
-                elif "knee" in issue_lower or "leg" in issue_lower:
-                    body_part = "knee"
-                else:
-                    body_part = "elbow"  # Default
+                # Determine which body part (elbow > release > knee; elbow by default)
+                hits = {m.lastindex for m in _BODY_PART_RE.finditer(shot.key_issue)}
+                body_part = _BODY_PARTS[min(hits) - 1] if hits else "elbow"
                 
                 severity = "error" if not shot.made else "warning"
                 issues.append({
@@ -1562,76 +2009,119 @@ class LiveAnalyzer:
             
             self.state.last_shot_issues = issues
             
-            # Create annotated frame from release frame
-            if shot.frames and len(shot.frames) > 4:
-                # Get release frame (index 4-5 in 7-frame sequence)
-                label, release_frame = shot.frames[5] if len(shot.frames) > 5 else shot.frames[-1]
+            annotated = self._build_annotated(shot, metrics, issues)
+            if annotated is not None:
+                self.state.last_shot_annotated = annotated
                 
-                # Get landmarks from shot detector's buffer if available
-                # For now, we'll run pose detection on the release frame
-                landmarks, _ = self.pose.detect(release_frame)
-                
-                if landmarks:
-                    annotator = FrameAnnotator()
-                    
-                    if issues:
-                        # Create highlighted version
-                        comp = ComparisonGenerator()
-                        annotated = comp.create_improvement_highlight(
-                            release_frame, landmarks, metrics, issues
-                        )
-                    else:
-                        # Create standard annotated version
-                        annotated = annotator.annotate_shot_frame(
-                            release_frame, landmarks, metrics, "release"
-                        )
-                    
-                    # Add shot result header
-                    h, w = annotated.shape[:2]
-                    header_h = 50
-                    header = np.zeros((header_h, w, 3), dtype=np.uint8)
-                    
-                    if shot.made:
-                        cv2.rectangle(header, (0, 0), (w, header_h), (0, 100, 0), -1)
-                        result_text = f"SHOT #{shot.shot_number} - MADE"
-                    else:
-                        cv2.rectangle(header, (0, 0), (w, header_h), (0, 0, 100), -1)
-                        miss_str = f" ({shot.miss_type})" if shot.miss_type else ""
-                        result_text = f"SHOT #{shot.shot_number} - MISSED{miss_str}"
-                    
-                    cv2.putText(header, result_text, (15, 35),
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.9, (255, 255, 255), 2)
-                    
-                    if shot.form_rating:
-                        rating_text = f"Form: {shot.form_rating}/10"
-                        cv2.putText(header, rating_text, (w - 150, 35),
-                                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-                    
-                    annotated = np.vstack([header, annotated])
-                    
-                    # Add feedback footer
-                    if shot.feedback:
-                        footer_h = 60
-                        footer = np.zeros((footer_h, w, 3), dtype=np.uint8)
-                        footer[:] = (30, 30, 30)
-                        
-                        # Truncate feedback if needed
-                        feedback_text = shot.feedback[:80] + "..." if len(shot.feedback) > 80 else shot.feedback
-                        cv2.putText(footer, feedback_text, (15, 35),
-                                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (200, 200, 200), 1)
-                        
-                        if shot.quick_cue:
-                            cue_text = f'Cue: "{shot.quick_cue}"'
-                            cv2.putText(footer, cue_text, (w - 250, 35),
-                                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 165, 255), 1)
-                        
-                        annotated = np.vstack([annotated, footer])
-                    
-                    self.state.last_shot_annotated = annotated
+                # Auto-show the annotated shot window if enabled
+                if self.auto_show_analysis:
+                    self.state.show_last_shot = True
+            
+            # Gemini and the debug dump are done with the frames by now, so keep
+            # only small copies and drop the full-resolution buffer
+            self.state.last_shot_frames = [
+                (label, self._shrink_frame(frame)) for label, frame in shot.frames
+            ]
+            shot.frames = None
                     
         except Exception as e:
             print(f"Warning: Could not generate shot visualization: {e}")
     
+    @staticmethod
+    def _shrink_frame(frame: np.ndarray) -> np.ndarray:
+        """Downscale a frame to KEPT_FRAME_WIDTH, preserving aspect ratio."""
+        h, w = frame.shape[:2]
+        if w <= KEPT_FRAME_WIDTH:
+            return frame
+        size = (KEPT_FRAME_WIDTH, max(1, round(h * KEPT_FRAME_WIDTH / w)))
+        return cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+    
+    def _build_annotated(self, shot: ShotEvent, metrics: Dict,
+                         issues: List[Dict]) -> Optional[np.ndarray]:
+        """Render the annotated release frame with result header and feedback footer."""
+        if not shot.frames or len(shot.frames) <= 4:
+            return None
+        
+        # Get release frame (index 4-5 in 7-frame sequence)
+        release_idx = 5 if len(shot.frames) > 5 else len(shot.frames) - 1
+        label, release_frame = shot.frames[release_idx]
+        
+        # Reuse the landmarks computed when the frame was captured
+        landmarks = shot.frame_landmarks[release_idx] if release_idx < len(shot.frame_landmarks) else {}
+        if not landmarks:
+            return None
+        
+        comp = self._comparison
+        
+        if issues:
+            # Create highlighted version
+            annotated = comp.create_improvement_highlight(
+                release_frame, landmarks, metrics, issues
+            )
+        else:
+            # Create standard annotated version
+            annotated = comp.annotator.annotate_shot_frame(
+                release_frame, landmarks, metrics, "release"
+            )
+        
+        # Header, annotated frame and footer are written straight into one canvas.
+        # It's allocated per shot: the capture thread keeps displaying/saving the
+        # published image while the next shot renders.
+        h, w = annotated.shape[:2]
+        header_h = 50
+        footer_h = 60 if shot.feedback else 0
+        canvas = np.empty((header_h + h + footer_h, w, 3), dtype=np.uint8)
+        header = canvas[:header_h]
+        
+        # Add shot result header
+        if shot.made:
+            cv2.rectangle(header, (0, 0), (w, header_h), (0, 100, 0), -1)
+            result_text = f"SHOT #{shot.shot_number} - MADE"
+        else:
+            cv2.rectangle(header, (0, 0), (w, header_h), (0, 0, 100), -1)
+            miss_str = f" ({shot.miss_type})" if shot.miss_type else ""
+            result_text = f"SHOT #{shot.shot_number} - MISSED{miss_str}"
+        
+        cv2.putText(header, result_text, (15, 35),
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.9, (255, 255, 255), 2)
+        
+        if shot.form_rating:
+            rating_text = f"Form: {shot.form_rating}/10"
+            cv2.putText(header, rating_text, (w - 150, 35),
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+        
+        canvas[header_h:header_h + h] = annotated
+        
+        # Add feedback footer
+        if shot.feedback:
+            footer = canvas[header_h + h:]
+            footer.fill(30)
+            
+            # Truncate feedback if needed
+            feedback_text = shot.feedback[:80] + "..." if len(shot.feedback) > 80 else shot.feedback
+            cv2.putText(footer, feedback_text, (15, 35),
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (200, 200, 200), 1)
+            
+            if shot.quick_cue:
+                cue_text = f'Cue: "{shot.quick_cue}"'
+                cv2.putText(footer, cue_text, (w - 250, 35),
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 165, 255), 1)
+        
+        return canvas
+    
+    def _detect_rim(self, frame: np.ndarray):
+        """Detect the rim, on a UMat while OpenCL is enabled."""
+        if self._use_opencl:
+            try:
+                return self.rim_detector.detect(cv2.UMat(frame))
+            except Exception as e:
+                # RimDetector may index or slice its input like an ndarray,
+                # which a UMat doesn't support - fall back to the CPU for good
+                print(f"⚠️  OpenCL rim detection failed ({e}) - using CPU")
+                self._use_opencl = False
+                cv2.ocl.setUseOpenCL(False)
+        return self.rim_detector.detect(frame)
+    
     def run(self):
         """Main loop."""
         cap = cv2.VideoCapture(self.source)
@@ -1642,13 +2132,36 @@ class LiveAnalyzer:
         
         fps = cap.get(cv2.CAP_PROP_FPS) or 30
         frame_time = 1.0 / fps
+        tracker_stride = max(1, int(fps / TRACKER_HZ))
+        rim_interval = max(1, int(fps * RIM_REDETECT_SECONDS))
         
         print(f"Video source opened: {int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))}x{int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))} @ {fps:.0f}fps")
         print("Running...\n")
         
+        # Monotonic frame schedule: each tick is a fixed offset from the last,
+        # so sleep jitter doesn't accumulate into drift
+        next_tick = time.perf_counter()
+        
+        # Bind hot attributes and per-frame loop state to locals
+        # ('s' rebinds shot_update / vis_draw when it swaps the detector)
+        submit = self._infer_pool.submit
+        pose_detect = self.pose.detect
+        ball_detect = self.ball.detect
+        rim_detect = self._detect_rim if self.rim_detector else None
+        tracker_update = self.make_miss_tracker.update if self.make_miss_tracker else None
+        shot_update = self.shot_detector.update
+        current_angle = self.shot_detector.get_current_angle
+        vis_draw = self.visualizer.draw
+        state = self.state
+        perf_counter = time.perf_counter
+        frame_count = self.frame_count
+        last_wrist_px = None  # Previous frame's wrist, used as the ball prior
+        last_tracker_frame = 0  # Last frame fed to the make/miss tracker
+        rim_bbox = None  # Cached between re-detections
+        rim_last_detect_frame = 0
+        
         while True:
-            start_time = time.time()
-            self.frame_count += 1
+            frame_count += 1
             
             ret, frame = cap.read()
             if not ret:
@@ -1657,36 +2170,58 @@ class LiveAnalyzer:
                     break
                 continue
             
-            # Detect pose
-            landmarks, visibility = self.pose.detect(frame)
+            # Ball detection runs on a downscaled copy; pose keeps the full frame
+            # (it letterboxes to its own input size). So does the rim detector:
+            # MakeMissTracker reads its rim state and compares it against
+            # full-frame ball positions.
+            frame_h, frame_w = frame.shape[:2]
+            det_scale = DETECT_WIDTH / frame_w if frame_w > DETECT_WIDTH else 1.0
+            small = frame
+            if det_scale < 1.0:
+                small = cv2.resize(frame, (DETECT_WIDTH, int(frame_h * det_scale)),
+                                   interpolation=cv2.INTER_AREA)
+            
+            # Detect pose, ball and rim concurrently. Ball detection uses the
+            # previous frame's wrist as its prior so it doesn't wait on pose.
+            pose_fut = submit(pose_detect, frame)
+            ball_fut = submit(ball_detect, small, last_wrist_px, det_scale)
+            rim_fut = None
+            rim_due = (rim_bbox is None or
+                       frame_count - rim_last_detect_frame >= rim_interval)
+            if rim_detect and rim_due:
+                rim_last_detect_frame = frame_count
+                rim_fut = submit(rim_detect, frame)
             
-            # Detect ball
+            landmarks, visibility = pose_fut.result()
+            ball_pos = ball_fut.result()
+            if rim_fut:
+                rim_bbox = rim_fut.result()
+            
+            # Cache wrist pixel position for the next frame's ball prior
             wrist = landmarks.get(f"{self.side}_wrist")
-            wrist_px = None
+            last_wrist_px = None
             if wrist:
-                h, w = frame.shape[:2]
-                wrist_px = (int(wrist[0] * w), int(wrist[1] * h))
-            ball_pos = self.ball.detect(frame, wrist_px)
+                last_wrist_px = (int(wrist[0] * frame_w), int(wrist[1] * frame_h))
             
-            # Detect rim (for make/miss tracking)
-            rim_bbox = None
-            if self.rim_detector:
-                rim_bbox = self.rim_detector.detect(frame)
-                
-                # Track ball trajectory for make/miss
-                if ball_pos and self.make_miss_tracker:
-                    ball_center = (ball_pos[0], ball_pos[1])
-                    make_miss_result = self.make_miss_tracker.update(ball_center, self.frame_count)
-                    
-                    if make_miss_result:
-                        # Store result for next shot analysis
-                        self._last_make_miss = make_miss_result
+            if rim_detect:
+                # Track ball trajectory for make/miss. A ~20 Hz trajectory is
+                # plenty for the flight, except near the rim where every frame counts.
+                if ball_pos and tracker_update:
+                    near_rim = bool(rim_bbox) and abs(ball_pos[1] - (rim_bbox[1] + rim_bbox[3] // 2)) < RIM_ROI_PX
+                    if near_rim or frame_count - last_tracker_frame >= tracker_stride:
+                        last_tracker_frame = frame_count
+                        ball_center = (ball_pos[0], ball_pos[1])
+                        make_miss_result = tracker_update(ball_center, frame_count)
+                        
+                        if make_miss_result:
+                            # Store result for next shot analysis
+                            self._last_make_miss = make_miss_result
             
             # Detect shot
-            shot_event = self.shot_detector.update(frame, landmarks, visibility)
+            shot_event = shot_update(frame, landmarks, visibility)
             if shot_event:
-                self.state.total_shots += 1
-                shot_event.shot_number = self.state.total_shots
+                state.total_shots += 1
+                shot_event.shot_number = state.total_shots
                 
                 # Perform local biomechanics analysis (research-based, not NBA player comparisons)
                 local_analysis = None
@@ -1695,28 +2230,20 @@ class LiveAnalyzer:
                 print(f"   Wrist height: {shot_event.wrist_height_release:.2f} | Knee bend: {shot_event.knee_bend_load:.0f}°")
                 
                 if BIOMECHANICS_AVAILABLE:
-                    # Get height-based recommendations
-                    height_profile = None
-                    if self.player_profile.height_inches:
-                        height_profile = get_height_profile(self.player_profile.height_inches)
-                    
                     # Check vs research benchmarks
-                    vs_research = {}
                     elbow_load = shot_event.elbow_angle_load
-                    if ELBOW_ANGLE_LOAD.min_val <= elbow_load <= ELBOW_ANGLE_LOAD.max_val:
-                        vs_research["elbow"] = "optimal"
-                    elif elbow_load < ELBOW_ANGLE_LOAD.min_val:
-                        vs_research["elbow"] = "below_optimal"
+                    elbow_min, elbow_max = ELBOW_ANGLE_LOAD.min_val, ELBOW_ANGLE_LOAD.max_val
+                    if elbow_min <= elbow_load <= elbow_max:
+                        elbow_status = "optimal"
+                    elif elbow_load < elbow_min:
+                        elbow_status = "below_optimal"
                     else:
-                        vs_research["elbow"] = "above_optimal"
+                        elbow_status = "above_optimal"
+                    vs_research = {"elbow": elbow_status}
                     
+                    # Height-based recommendations are cached for the session
                     local_analysis = {
-                        "height_profile": {
-                            "category": height_profile.category if height_profile else "N/A",
-                            "release_speed": height_profile.release_speed if height_profile else "moderate",
-                            "arc_emphasis": height_profile.arc_emphasis if height_profile else "standard",
-                            "key_principles": height_profile.key_principles if height_profile else [],
-                        } if height_profile else None,
+                        "height_profile": self._height_profile_dict,
                         "vs_research": vs_research
                     }
                     
@@ -1728,32 +2255,24 @@ class LiveAnalyzer:
                 
                 print(f"   Sending {len(shot_event.frames)} frames to Gemini...")
                 
-                # Save frames if debug mode enabled
+                # Save frames if debug mode enabled (encoded on the worker)
                 if self.debug_frames and shot_event.frames:
-                    debug_dir = Path("debug_frames")
-                    debug_dir.mkdir(exist_ok=True)
-                    shot_dir = debug_dir / f"shot_{shot_event.shot_number}"
-                    shot_dir.mkdir(exist_ok=True)
-                    
-                    print(f"   💾 Saving {len(shot_event.frames)} frames to {shot_dir}/")
-                    for i, (label, frame_img) in enumerate(shot_event.frames):
-                        filename = shot_dir / f"{i}_{label.replace(' ', '_')}.jpg"
-                        cv2.imwrite(str(filename), frame_img)
-                    print(f"   ✓ Frames saved for debugging")
+                    print(f"   💾 Saving {len(shot_event.frames)} frames to debug_frames/shot_{shot_event.shot_number}/")
+                    self._viz_queue.put((self._save_debug_frames, shot_event))
                 
                 # Send to Gemini for analysis (pass state and local analysis)
                 self.gemini.analyze_shot_async(
                     shot_event, 
-                    self.state, 
+                    state, 
                     self.on_shot_analyzed,
                     local_analysis=local_analysis
                 )
             
             # Get current elbow angle
-            elbow_angle = self.shot_detector.get_current_angle()
+            elbow_angle = current_angle()
             
             # Draw visualization
-            frame = self.visualizer.draw(frame, landmarks, ball_pos, elbow_angle, self.state)
+            frame = vis_draw(frame, landmarks, ball_pos, elbow_angle, state)
             
             # Draw rim if detected
             if rim_bbox:
@@ -1762,9 +2281,9 @@ class LiveAnalyzer:
                 cv2.putText(frame, "RIM", (x, y-5), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 165, 255), 2)
             
             # Show last shot annotated view if toggled
-            if self.state.show_last_shot and self.state.last_shot_annotated is not None:
+            if state.show_last_shot and state.last_shot_annotated is not None:
                 # Show annotated shot in separate window
-                cv2.imshow('Last Shot Analysis', self.state.last_shot_annotated)
+                cv2.imshow('Last Shot Analysis', state.last_shot_annotated)
             
             # Display
             cv2.imshow('FormCheck Live', frame)
@@ -1778,36 +2297,51 @@ class LiveAnalyzer:
                 self.side = "left" if self.side == "right" else "right"
                 self.shot_detector = LiveShotDetector(self.side)
                 self.visualizer = LiveVisualizer(self.side)
+                shot_update = self.shot_detector.update
+                current_angle = self.shot_detector.get_current_angle
+                vis_draw = self.visualizer.draw
+                last_wrist_px = None
                 print(f"Switched to {self.side.upper()} hand")
             elif key == ord('v'):
                 # Toggle last shot view
-                self.state.show_last_shot = not self.state.show_last_shot
-                if self.state.show_last_shot:
-                    if self.state.last_shot_annotated is not None:
+                state.show_last_shot = not state.show_last_shot
+                if state.show_last_shot:
+                    if state.last_shot_annotated is not None:
                         print("📸 Showing last shot analysis (press 'v' to hide)")
                     else:
                         print("No shot analyzed yet")
-                        self.state.show_last_shot = False
+                        state.show_last_shot = False
                 else:
                     cv2.destroyWindow('Last Shot Analysis')
                     print("Hiding shot analysis")
             elif key == ord('p'):
                 # Save annotated shot as PNG
-                if self.state.last_shot_annotated is not None:
+                if state.last_shot_annotated is not None:
                     timestamp = time.strftime("%Y%m%d_%H%M%S")
-                    filename = f"shot_{self.state.total_shots}_{timestamp}.png"
-                    cv2.imwrite(filename, self.state.last_shot_annotated)
+                    filename = f"shot_{state.total_shots}_{timestamp}.png"
+                    cv2.imwrite(filename, state.last_shot_annotated)
                     print(f"💾 Saved: {filename}")
                 else:
                     print("No shot to save yet")
             
-            # Maintain frame rate
-            elapsed = time.time() - start_time
-            if elapsed < frame_time:
-                time.sleep(frame_time - elapsed)
+            # Maintain frame rate: coarse sleep, then spin the last 0.5ms
+            next_tick += frame_time
+            sleep_for = next_tick - perf_counter()
+            if sleep_for > 0.001:
+                time.sleep(sleep_for - 0.0005)
+            if sleep_for > 0:
+                while perf_counter() < next_tick:
+                    pass
+            else:
+                # Overran the frame budget - don't sleep, just resync to now
+                next_tick = perf_counter()
         
+        self.frame_count = frame_count
         cap.release()
         cv2.destroyAllWindows()
+        self._infer_pool.shutdown(wait=True)
+        self._viz_queue.put(None)
+        self._viz_thread.join()
         self.pose.close()
         
         # Generate and print session summary
@@ -1829,16 +2363,15 @@ class LiveAnalyzer:
             print(f"   Shooting %: {pct:.1f}%")
         
         # Form ratings
-        ratings = [h.get('form_rating') for h in self.state.shot_history if h.get('form_rating')]
-        if ratings:
-            avg_rating = sum(ratings) / len(ratings)
+        ratings = self.state.form_ratings[:len(self.state.shot_history)]
+        ratings = ratings[ratings > 0]
+        if ratings.size:
+            avg_rating = float(ratings.mean())
             print(f"   Avg Form Rating: {avg_rating:.1f}/10")
         
         # Miss patterns
-        miss_types = [h.get('miss_type') for h in self.state.shot_history if h.get('miss_type')]
-        if miss_types:
-            miss_counts = Counter(miss_types)
-            most_common = miss_counts.most_common(1)[0]
+        if self.state.miss_types:
+            most_common = Counter(self.state.miss_types).most_common(1)[0]
             print(f"   Most common miss: {most_common[0]} ({most_common[1]}x)")
         
         # Show patterns discovered
@@ -1855,11 +2388,10 @@ class LiveAnalyzer:
                 print(f"   💡 Your elbow is {abs(elbow_diff):.0f}° {'higher' if elbow_diff > 0 else 'lower'} when you make shots")
         
         # Quick cues that were given
-        cues = [h.get('quick_cue') for h in self.state.shot_history if h.get('quick_cue')]
-        if cues:
+        if self.state.quick_cues:
             print(f"\n🎯 CUES TO REMEMBER")
             # Show unique cues
-            unique_cues = list(dict.fromkeys(cues))[:3]
+            unique_cues = list(dict.fromkeys(self.state.quick_cues))[:3]
             for cue in unique_cues:
                 print(f"   • \"{cue}\"")
         
@@ -1908,6 +2440,7 @@ class LiveAnalyzer:
         
         # Save session to database
         if self.db and self.session_id:
+            self._flush_shot_records()
             self.db.end_session(self.session_id, grade=grade, summary=summary_text)
             self.db.update_player_stats(self.player_id)
             print(f"\n💾 Session saved to database")
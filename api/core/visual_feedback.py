@@ -12,11 +12,24 @@ Generates annotated images and overlays for visual coaching feedback:
 
 import cv2
 import numpy as np
+import os
+import textwrap
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, List, Dict, Tuple
 from pathlib import Path
 import math
 
+# CUDA is optional: only present in OpenCV builds with CUDA and a visible device
+try:
+    CUDA_AVAILABLE = cv2.cuda.getCudaEnabledDeviceCount() > 0
+except (AttributeError, cv2.error):
+    CUDA_AVAILABLE = False
+
+# Optional JIT for the per-joint scalar helpers (plain Python without numba)
+from jit import njit
+
 
 # =============================================================================
 # Color Schemes
@@ -59,12 +72,121 @@ class AnnotationConfig:
     font_scale: float = 0.6
     angle_arc_radius: int = 40
     show_ideal_ghost: bool = True
+    panel_alpha: float = 0.7  # Metrics panel opacity; >= 0.99 is a plain fill
+
+
+# =============================================================================
+# Text Layout Utilities
+# =============================================================================
+
+@lru_cache(maxsize=512)
+def _text_size(text: str, font: int, scale: float,
+               thickness: int) -> Tuple[Tuple[int, int], int]:
+    """Cached cv2.getTextSize - labels and values repeat across frames."""
+    return cv2.getTextSize(text, font, scale, thickness)
+
+
+@lru_cache(maxsize=8)
+def _char_advances(font: int) -> np.ndarray:
+    """Per-character advance (font units) for printable ASCII, calibrated once.
+    
+    getTextSize accumulates advance * scale per character and returns
+    rint(total + thickness), so a running sum over this table reproduces it.
+    """
+    advances = np.zeros(128, dtype=np.float64)
+    for code in range(32, 127):
+        (w, _), _ = cv2.getTextSize(chr(code), font, 1.0, 1)
+        advances[code] = w - 1
+    return advances
+
+
+def _wrap_text_exact(words: List[str], max_width: int, font: int, scale: float,
+                     thickness: int) -> Tuple[str, ...]:
+    """Greedy word wrap measuring every candidate line with getTextSize."""
+    lines = []
+    current_line = ""
+    
+    for word in words:
+        test_line = current_line + " " + word if current_line else word
+        (tw, _), _ = _text_size(test_line, font, scale, thickness)
+        if tw < max_width:
+            current_line = test_line
+        else:
+            lines.append(current_line)
+            current_line = word
+    if current_line:
+        lines.append(current_line)
+    
+    return tuple(lines)
+
+
+@lru_cache(maxsize=64)
+def _wrap_text(text: str, max_width: int, font: int, scale: float,
+               thickness: int) -> Tuple[str, ...]:
+    """Greedy word wrap to max_width pixels.
+    
+    Break points come from cumulative character widths; getTextSize is only
+    called once per final line to confirm the layout.
+    """
+    words = text.split()
+    if not words:
+        return ()
+    
+    # The table only covers printable ASCII
+    joined = " ".join(words)
+    if not joined.isascii() or not joined.isprintable():
+        return _wrap_text_exact(words, max_width, font, scale, thickness)
+    
+    # Per-character pixel widths of the single-spaced text, and word spans
+    codes = np.frombuffer(joined.encode("ascii"), dtype=np.uint8)
+    char_px = _char_advances(font)[codes] * scale
+    lens = np.array([len(w) for w in words])
+    ends = np.cumsum(lens + 1) - 1
+    starts = ends - lens
+    
+    lines = []
+    i, n = 0, len(words)
+    while i < n:
+        # Running width from word i, summed in the same order as getTextSize,
+        # read off at the end of each candidate last word
+        acc = np.cumsum(char_px[starts[i]:])
+        px = np.rint(acc[ends[i:] - starts[i] - 1] + thickness)
+        if i == 0 and px[0] >= max_width:
+            lines.append("")  # Matches the greedy loop: an over-wide first word starts a new line
+        
+        # Word i always starts the line; extend while the pixel width still fits
+        k = int(np.searchsorted(px[1:], max_width, side="left"))
+        lines.append(" ".join(words[i:i + k + 1]))
+        i += k + 1
+    
+    # Confirm with one measurement per line; fall back if the table disagrees
+    for line in lines:
+        if " " in line and _text_size(line, font, scale, thickness)[0][0] >= max_width:
+            return _wrap_text_exact(words, max_width, font, scale, thickness)
+    
+    return tuple(lines)
 
 
 # =============================================================================
 # Angle Drawing Utilities
 # =============================================================================
 
+@njit(cache=True)
+def _arc_geometry(deltas: np.ndarray, cx: float, cy: float,
+                  text_r: float) -> Tuple[float, float, int, int]:
+    """Arc start/end (degrees) and the value label position for draw_angle_arc.
+    
+    deltas: (2, 2) float64 array of the two arm vectors from the joint.
+    """
+    # Both arm angles in one call
+    angles = np.arctan2(deltas[:, 1], deltas[:, 0])
+    degrees = np.degrees(angles)
+    mid_angle = angles.mean()
+    text_x = int(cx + text_r * math.cos(mid_angle))
+    text_y = int(cy + text_r * math.sin(mid_angle))
+    return float(degrees[0]), float(degrees[1]), text_x, text_y
+
+
 def draw_angle_arc(frame: np.ndarray, center: Tuple[int, int], 
                    p1: Tuple[int, int], p2: Tuple[int, int],
                    angle: float, color: Tuple[int, int, int],
@@ -73,44 +195,63 @@ def draw_angle_arc(frame: np.ndarray, center: Tuple[int, int],
     """
     Draw an angle arc at a joint with the angle value.
     """
-    # Calculate angles for the arc
-    angle1 = math.atan2(p1[1] - center[1], p1[0] - center[0])
-    angle2 = math.atan2(p2[1] - center[1], p2[0] - center[0])
-    
-    start_angle = math.degrees(angle1)
-    end_angle = math.degrees(angle2)
+    # Calculate angles for the arc and the label position
+    deltas = np.array([p1, p2], dtype=np.float64) - center
+    start_angle, end_angle, text_x, text_y = _arc_geometry(
+        deltas, float(center[0]), float(center[1]), float(radius + 20)
+    )
     
     # Draw arc
     cv2.ellipse(frame, center, (radius, radius), 0, 
-                start_angle, end_angle, color, thickness)
+                start_angle, end_angle, color, thickness, lineType=cv2.LINE_8)
     
     # Draw angle value
     if show_value:
-        mid_angle = (angle1 + angle2) / 2
-        text_x = int(center[0] + (radius + 20) * math.cos(mid_angle))
-        text_y = int(center[1] + (radius + 20) * math.sin(mid_angle))
-        
         # Background for text
         text = f"{angle:.0f}°"
-        (tw, th), _ = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)
+        (tw, th), _ = _text_size(text, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)
         cv2.rectangle(frame, (text_x - 5, text_y - th - 5), 
-                     (text_x + tw + 5, text_y + 5), color, -1)
+                     (text_x + tw + 5, text_y + 5), color, -1, lineType=cv2.LINE_8)
         cv2.putText(frame, text, (text_x, text_y), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, Colors.TEXT_LIGHT, 2)
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, Colors.TEXT_LIGHT, 2, lineType=cv2.LINE_AA)
     
     return frame
 
 
-def get_status_color(value: float, ideal_range: Tuple[float, float]) -> Tuple[int, int, int]:
-    """Get color based on how close value is to ideal range."""
-    min_ideal, max_ideal = ideal_range
+def landmarks_to_px(landmarks: Dict, w: int, h: int) -> Dict[str, Tuple[int, int]]:
+    """Convert normalized landmarks to integer pixel coordinates in one pass."""
+    if not landmarks:
+        return {}
+    
+    values = list(landmarks.values())
+    try:
+        arr = np.asarray(values, dtype=np.float64)[:, :2]
+    except ValueError:
+        # Mixed (x, y) / (x, y, z) tuples
+        arr = np.array([v[:2] for v in values], dtype=np.float64)
     
+    px = (arr * (w, h)).astype(np.int32).tolist()
+    return dict(zip(landmarks, map(tuple, px)))
+
+
+@njit(cache=True)
+def _status_color_idx(value: float, min_ideal: float, max_ideal: float) -> int:
+    """0 = in range, 1 = within 10 of it, 2 = outside."""
     if min_ideal <= value <= max_ideal:
-        return Colors.GOOD
+        return 0
     elif min_ideal - 10 <= value <= max_ideal + 10:
-        return Colors.WARNING
+        return 1
     else:
-        return Colors.BAD
+        return 2
+
+
+_STATUS_COLORS = (Colors.GOOD, Colors.WARNING, Colors.BAD)
+
+
+def get_status_color(value: float, ideal_range: Tuple[float, float]) -> Tuple[int, int, int]:
+    """Get color based on how close value is to ideal range."""
+    min_ideal, max_ideal = ideal_range
+    return _STATUS_COLORS[_status_color_idx(float(value), float(min_ideal), float(max_ideal))]
 
 
 # =============================================================================
@@ -120,11 +261,56 @@ def get_status_color(value: float, ideal_range: Tuple[float, float]) -> Tuple[in
 class FrameAnnotator:
     """Annotates video frames with form analysis."""
     
+    # Fixed joint ordering for the skeleton; connections index into it
+    SKELETON_JOINTS = (
+        "right_shoulder", "right_elbow", "right_wrist",
+        "left_shoulder", "left_elbow", "left_wrist",
+        "right_hip", "left_hip",
+        "right_knee", "right_ankle", "left_knee", "left_ankle",
+    )
+    _J = {name: i for i, name in enumerate(SKELETON_JOINTS)}
+    
+    # Connections grouped by color, in draw order (one polylines call per group)
+    SKELETON_GROUPS = (
+        # Shooting arm (orange)
+        (Colors.SHOOTING_ARM, np.array([
+            [_J["right_shoulder"], _J["right_elbow"]],
+            [_J["right_elbow"], _J["right_wrist"]],
+        ], dtype=np.int32)),
+        # Guide arm
+        (Colors.GUIDE_ARM, np.array([
+            [_J["left_shoulder"], _J["left_elbow"]],
+            [_J["left_elbow"], _J["left_wrist"]],
+        ], dtype=np.int32)),
+        # Torso
+        (Colors.TORSO, np.array([
+            [_J["left_shoulder"], _J["right_shoulder"]],
+            [_J["left_shoulder"], _J["left_hip"]],
+            [_J["right_shoulder"], _J["right_hip"]],
+            [_J["left_hip"], _J["right_hip"]],
+        ], dtype=np.int32)),
+        # Legs
+        (Colors.LEGS, np.array([
+            [_J["left_hip"], _J["left_knee"]],
+            [_J["left_knee"], _J["left_ankle"]],
+            [_J["right_hip"], _J["right_knee"]],
+            [_J["right_knee"], _J["right_ankle"]],
+        ], dtype=np.int32)),
+    )
+    SHOOTING_JOINTS = frozenset(("right_shoulder", "right_elbow", "right_wrist"))
+    
     def __init__(self, config: AnnotationConfig = None):
         self.config = config or AnnotationConfig()
     
+    def resize(self, frame: np.ndarray, size: Tuple[int, int]) -> np.ndarray:
+        """Resize a frame to (w, h) for layout."""
+        return cv2.resize(frame, size)
+    
     def annotate_shot_frame(self, frame: np.ndarray, landmarks: Dict,
-                           metrics: Dict, phase: str = "release") -> np.ndarray:
+                           metrics: Dict, phase: str = "release",
+                           inplace: bool = False, draw_angles: bool = True,
+                           draw_panel: bool = True,
+                           px_out: Optional[Dict] = None) -> np.ndarray:
         """
         Annotate a single frame with form analysis.
         
@@ -133,23 +319,29 @@ class FrameAnnotator:
             landmarks: Pose landmarks (normalized 0-1)
             metrics: Shot metrics dict with elbow_load, elbow_release, etc.
             phase: "load", "release", or "follow_through"
+            inplace: Draw directly on frame instead of a copy (caller owns the buffer)
+            draw_angles: Draw the angle arcs and labels
+            draw_panel: Draw the metrics panel
+            px_out: If given, filled with the pixel landmarks used for drawing
         """
-        annotated = frame.copy()
+        annotated = frame if inplace else frame.copy()
         h, w = frame.shape[:2]
         
-        # Convert landmarks to pixel coordinates
-        px_landmarks = {}
-        for name, pos in landmarks.items():
-            px_landmarks[name] = (int(pos[0] * w), int(pos[1] * h))
+        # Convert landmarks to pixel coordinates (shared by every draw step)
+        px_landmarks = landmarks_to_px(landmarks, w, h)
+        if px_out is not None:
+            px_out.update(px_landmarks)
         
         # Draw skeleton with color coding
         self._draw_annotated_skeleton(annotated, px_landmarks, metrics, phase)
         
         # Draw angle annotations
-        self._draw_angle_annotations(annotated, px_landmarks, metrics, phase)
+        if draw_angles:
+            self._draw_angle_annotations(annotated, px_landmarks, metrics, phase)
         
         # Draw metrics panel
-        self._draw_metrics_panel(annotated, metrics, phase)
+        if draw_panel:
+            self._draw_metrics_panel(annotated, metrics, phase)
         
         return annotated
     
@@ -157,38 +349,30 @@ class FrameAnnotator:
                                   metrics: Dict, phase: str):
         """Draw skeleton with color-coded body parts."""
         
-        # Define connections with colors
-        connections = [
-            # Shooting arm (orange)
-            (("right_shoulder", "right_elbow"), Colors.SHOOTING_ARM),
-            (("right_elbow", "right_wrist"), Colors.SHOOTING_ARM),
-            # Guide arm
-            (("left_shoulder", "left_elbow"), Colors.GUIDE_ARM),
-            (("left_elbow", "left_wrist"), Colors.GUIDE_ARM),
-            # Torso
-            (("left_shoulder", "right_shoulder"), Colors.TORSO),
-            (("left_shoulder", "left_hip"), Colors.TORSO),
-            (("right_shoulder", "right_hip"), Colors.TORSO),
-            (("left_hip", "right_hip"), Colors.TORSO),
-            # Legs
-            (("left_hip", "left_knee"), Colors.LEGS),
-            (("left_knee", "left_ankle"), Colors.LEGS),
-            (("right_hip", "right_knee"), Colors.LEGS),
-            (("right_knee", "right_ankle"), Colors.LEGS),
-        ]
+        # Gather joints into the fixed ordering, noting which are present
+        n = len(self.SKELETON_JOINTS)
+        pts = np.zeros((n, 2), dtype=np.int32)
+        present = np.zeros(n, dtype=bool)
+        for i, name in enumerate(self.SKELETON_JOINTS):
+            pos = landmarks.get(name)
+            if pos is not None:
+                pts[i] = pos
+                present[i] = True
         
-        for (start, end), color in connections:
-            if start in landmarks and end in landmarks:
-                cv2.line(frame, landmarks[start], landmarks[end], color, 3)
+        # One polylines call per color group, skipping segments with a missing end
+        for color, idx in self.SKELETON_GROUPS:
+            segments = pts[idx[present[idx].all(axis=1)]]
+            if len(segments):
+                cv2.polylines(frame, list(segments), False, color, 3, lineType=cv2.LINE_8)
         
         # Draw joints
         for name, pos in landmarks.items():
             # Highlight shooting arm joints
-            if "right_" in name and any(j in name for j in ["shoulder", "elbow", "wrist"]):
-                cv2.circle(frame, pos, 8, Colors.SHOOTING_ARM, -1)
-                cv2.circle(frame, pos, 8, Colors.TEXT_LIGHT, 2)
+            if name in self.SHOOTING_JOINTS:
+                cv2.circle(frame, pos, 8, Colors.SHOOTING_ARM, -1, lineType=cv2.LINE_8)
+                cv2.circle(frame, pos, 8, Colors.TEXT_LIGHT, 2, lineType=cv2.LINE_8)
             else:
-                cv2.circle(frame, pos, 5, Colors.TEXT_LIGHT, -1)
+                cv2.circle(frame, pos, 5, Colors.TEXT_LIGHT, -1, lineType=cv2.LINE_8)
     
     def _draw_angle_annotations(self, frame: np.ndarray, landmarks: Dict,
                                  metrics: Dict, phase: str):
@@ -235,15 +419,18 @@ class FrameAnnotator:
         panel_w, panel_h = 200, 120
         panel_x, panel_y = 10, 10
         
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (panel_x, panel_y), 
-                     (panel_x + panel_w, panel_y + panel_h),
-                     (0, 0, 0), -1)
-        cv2.addWeighted(overlay, 0.7, frame, 0.3, 0, frame)
+        # Darken just the panel area (rectangle corners are inclusive)
+        alpha = self.config.panel_alpha
+        if alpha >= 0.99:
+            cv2.rectangle(frame, (panel_x, panel_y), (panel_x + panel_w, panel_y + panel_h),
+                         (0, 0, 0), -1, lineType=cv2.LINE_8)
+        else:
+            roi = frame[panel_y:panel_y + panel_h + 1, panel_x:panel_x + panel_w + 1]
+            roi[:] = cv2.addWeighted(np.zeros_like(roi), alpha, roi, 1 - alpha, 0)
         
         # Title
         cv2.putText(frame, phase.upper(), (panel_x + 10, panel_y + 25),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, Colors.PRIMARY, 2)
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, Colors.PRIMARY, 2, lineType=cv2.LINE_AA)
         
         # Metrics
         y = panel_y + 50
@@ -259,10 +446,33 @@ class FrameAnnotator:
             if value:
                 text = f"{label}: {value:.0f}{unit}" if unit == "°" else f"{label}: {value:.2f}"
                 cv2.putText(frame, text, (panel_x + 10, y),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.5, Colors.TEXT_LIGHT, 1)
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.5, Colors.TEXT_LIGHT, 1,
+                           lineType=cv2.LINE_AA)
                 y += 22
 
 
+class CudaFrameAnnotator(FrameAnnotator):
+    """FrameAnnotator that resizes on the GPU.
+    
+    OpenCV's CUDA module has no line/circle/text primitives, so annotation
+    itself still draws on the host; only the full-frame resampling moves.
+    """
+    
+    def resize(self, frame: np.ndarray, size: Tuple[int, int]) -> np.ndarray:
+        """Resize a frame to (w, h) on the GPU."""
+        # Per-call GpuMat keeps the shared instance safe across threads
+        gpu_src = cv2.cuda_GpuMat()
+        gpu_src.upload(frame)
+        return cv2.cuda.resize(gpu_src, size).download()
+
+
+# Annotators only hold config, so one instance is shared module-wide
+_DEFAULT_ANNOTATOR: FrameAnnotator = CudaFrameAnnotator() if CUDA_AVAILABLE else FrameAnnotator()
+
+# Shared renderers for independent frames - the OpenCV drawing calls release the GIL
+_RENDER_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+
 # =============================================================================
 # Comparison Views
 # =============================================================================
@@ -270,8 +480,8 @@ class FrameAnnotator:
 class ComparisonGenerator:
     """Generates side-by-side and overlay comparisons."""
     
-    def __init__(self):
-        self.annotator = FrameAnnotator()
+    def __init__(self, annotator: FrameAnnotator = None):
+        self.annotator = annotator or _DEFAULT_ANNOTATOR
     
     def create_side_by_side(self, user_frame: np.ndarray, user_landmarks: Dict,
                             user_metrics: Dict,
@@ -294,11 +504,12 @@ class ComparisonGenerator:
             # Resize reference to match
             ref_h, ref_w = reference_frame.shape[:2]
             scale = h / ref_h
-            reference_resized = cv2.resize(reference_frame, (int(ref_w * scale), h))
+            reference_resized = self.annotator.resize(reference_frame, (int(ref_w * scale), h))
             
-            # Annotate reference
+            # Annotate reference (the resized copy is ours to draw on)
             ref_annotated = self.annotator.annotate_shot_frame(
-                reference_resized, reference_landmarks, reference_metrics, "release"
+                reference_resized, reference_landmarks, reference_metrics, "release",
+                inplace=True
             )
             
             # Create side-by-side
@@ -306,31 +517,28 @@ class ComparisonGenerator:
             
             # Add labels
             cv2.putText(combined, "YOUR SHOT", (20, h - 20),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.8, Colors.PRIMARY, 2)
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.8, Colors.PRIMARY, 2, lineType=cv2.LINE_AA)
             cv2.putText(combined, reference_label, (w + 20, h - 20),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.8, Colors.GOOD, 2)
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.8, Colors.GOOD, 2, lineType=cv2.LINE_AA)
         else:
             combined = user_annotated
         
         return combined
     
     def create_improvement_highlight(self, frame: np.ndarray, landmarks: Dict,
-                                      metrics: Dict, issues: List[Dict]) -> np.ndarray:
+                                      metrics: Dict, issues: List[Dict],
+                                      inplace: bool = False) -> np.ndarray:
         """
         Highlight specific areas that need improvement.
         
         issues: List of dicts with 'body_part', 'message', 'severity'
+        inplace: Draw directly on frame instead of a copy (caller owns the buffer)
         """
-        annotated = frame.copy()
-        h, w = frame.shape[:2]
-        
-        # Convert landmarks
+        # Draw skeleton first, keeping the pixel landmarks for the callouts
         px_landmarks = {}
-        for name, pos in landmarks.items():
-            px_landmarks[name] = (int(pos[0] * w), int(pos[1] * h))
-        
-        # Draw skeleton first
-        self.annotator._draw_annotated_skeleton(annotated, px_landmarks, metrics, "release")
+        annotated = self.annotator.annotate_shot_frame(
+            frame, landmarks, metrics, "release", inplace=inplace,
+            draw_angles=False, draw_panel=False, px_out=px_landmarks)
         
         # Highlight problem areas
         for issue in issues:
@@ -355,21 +563,22 @@ class ComparisonGenerator:
                 pos = px_landmarks[landmark_key]
                 
                 # Draw attention circle
-                cv2.circle(annotated, pos, 35, color, 3)
-                cv2.circle(annotated, pos, 40, color, 2)
+                cv2.circle(annotated, pos, 35, color, 3, lineType=cv2.LINE_8)
+                cv2.circle(annotated, pos, 40, color, 2, lineType=cv2.LINE_8)
                 
                 # Draw callout line and text
                 text_x = pos[0] + 60
                 text_y = pos[1] - 30
                 
-                cv2.line(annotated, pos, (text_x - 10, text_y + 10), color, 2)
+                cv2.line(annotated, pos, (text_x - 10, text_y + 10), color, 2, lineType=cv2.LINE_8)
                 
                 # Text background
-                (tw, th), _ = cv2.getTextSize(message, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)
+                (tw, th), _ = _text_size(message, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)
                 cv2.rectangle(annotated, (text_x - 5, text_y - th - 5),
-                             (text_x + tw + 5, text_y + 5), color, -1)
+                             (text_x + tw + 5, text_y + 5), color, -1, lineType=cv2.LINE_8)
                 cv2.putText(annotated, message, (text_x, text_y),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.5, Colors.TEXT_LIGHT, 1)
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.5, Colors.TEXT_LIGHT, 1,
+                           lineType=cv2.LINE_AA)
         
         return annotated
 
@@ -381,6 +590,46 @@ class ComparisonGenerator:
 class ProTipCard:
     """Generates "Pro Tips" style coaching cards."""
     
+    HEADER_HEIGHT = 60
+    ILLUST_Y = HEADER_HEIGHT + 20
+    ILLUST_H = 200
+    
+    # (illustration_type, width, height) -> static card
+    _templates: Dict[Tuple[str, int, int], np.ndarray] = {}
+    
+    @staticmethod
+    def _card_template(illustration_type: str, width: int, height: int) -> np.ndarray:
+        """Background, header and illustration, rendered once per type and card size.
+        
+        The whole static card is cached rather than just the illustration box,
+        since some illustrations (the release ball) extend past it.
+        """
+        key = (illustration_type, width, height)
+        template = ProTipCard._templates.get(key)
+        if template is None:
+            # Create card background
+            template = np.full((height, width, 3), 255, dtype=np.uint8)
+            
+            # Yellow header
+            cv2.rectangle(template, (0, 0), (width, ProTipCard.HEADER_HEIGHT), Colors.PRIMARY, -1,
+                         lineType=cv2.LINE_8)
+            
+            # Header text
+            cv2.putText(template, "Pro Tips", (15, 40),
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.8, Colors.TEXT_DARK, 2, lineType=cv2.LINE_AA)
+            
+            # Illustration area (placeholder - would use actual images)
+            illust_y, illust_h = ProTipCard.ILLUST_Y, ProTipCard.ILLUST_H
+            cv2.rectangle(template, (20, illust_y), (width - 20, illust_y + illust_h),
+                         (240, 240, 240), -1, lineType=cv2.LINE_8)
+            
+            # Draw simple illustration based on type
+            ProTipCard._draw_illustration(template, illustration_type,
+                                           (20, illust_y, width - 40, illust_h))
+            
+            ProTipCard._templates[key] = template
+        return template
+    
     @staticmethod
     def create_tip_card(title: str, tip_text: str, 
                         illustration_type: str = "elbow",
@@ -390,52 +639,20 @@ class ProTipCard:
         
         illustration_type: "elbow", "knee", "release", "follow_through"
         """
-        # Create card background
-        card = np.ones((height, width, 3), dtype=np.uint8) * 255
-        
-        # Yellow header
-        header_height = 60
-        cv2.rectangle(card, (0, 0), (width, header_height), Colors.PRIMARY, -1)
-        
-        # Header text
-        cv2.putText(card, "Pro Tips", (15, 40),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.8, Colors.TEXT_DARK, 2)
-        
-        # Illustration area (placeholder - would use actual images)
-        illust_y = header_height + 20
-        illust_h = 200
-        cv2.rectangle(card, (20, illust_y), (width - 20, illust_y + illust_h),
-                     (240, 240, 240), -1)
-        
-        # Draw simple illustration based on type
-        ProTipCard._draw_illustration(card, illustration_type, 
-                                       (20, illust_y, width - 40, illust_h))
+        card = ProTipCard._card_template(illustration_type, width, height).copy()
         
         # Title
-        title_y = illust_y + illust_h + 40
+        title_y = ProTipCard.ILLUST_Y + ProTipCard.ILLUST_H + 40
         cv2.putText(card, title, (20, title_y),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, Colors.TEXT_DARK, 2)
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, Colors.TEXT_DARK, 2, lineType=cv2.LINE_AA)
         
         # Tip text (wrap)
         text_y = title_y + 30
-        words = tip_text.split()
-        lines = []
-        current_line = ""
-        
-        for word in words:
-            test_line = current_line + " " + word if current_line else word
-            (tw, _), _ = cv2.getTextSize(test_line, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)
-            if tw < width - 40:
-                current_line = test_line
-            else:
-                lines.append(current_line)
-                current_line = word
-        if current_line:
-            lines.append(current_line)
+        lines = _wrap_text(tip_text, width - 40, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)
         
         for line in lines[:6]:  # Max 6 lines
             cv2.putText(card, line.strip(), (20, text_y),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, Colors.SECONDARY, 1)
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, Colors.SECONDARY, 1, lineType=cv2.LINE_AA)
             text_y += 22
         
         return card
@@ -453,12 +670,12 @@ class ProTipCard:
             elbow = (cx, cy + 20)
             wrist = (cx + 50, cy - 50)
             
-            cv2.line(card, shoulder, elbow, Colors.TEXT_DARK, 8)
-            cv2.line(card, elbow, wrist, Colors.TEXT_DARK, 8)
-            cv2.circle(card, elbow, 12, Colors.PRIMARY, -1)
+            cv2.line(card, shoulder, elbow, Colors.TEXT_DARK, 8, lineType=cv2.LINE_8)
+            cv2.line(card, elbow, wrist, Colors.TEXT_DARK, 8, lineType=cv2.LINE_8)
+            cv2.circle(card, elbow, 12, Colors.PRIMARY, -1, lineType=cv2.LINE_8)
             
             # Angle arc
-            cv2.ellipse(card, elbow, (30, 30), 0, -120, -20, Colors.PRIMARY, 3)
+            cv2.ellipse(card, elbow, (30, 30), 0, -120, -20, Colors.PRIMARY, 3, lineType=cv2.LINE_8)
             
         elif illust_type == "knee":
             # Draw leg showing knee bend
@@ -466,9 +683,9 @@ class ProTipCard:
             knee = (cx - 20, cy + 20)
             ankle = (cx - 10, cy + 80)
             
-            cv2.line(card, hip, knee, Colors.TEXT_DARK, 8)
-            cv2.line(card, knee, ankle, Colors.TEXT_DARK, 8)
-            cv2.circle(card, knee, 12, Colors.PRIMARY, -1)
+            cv2.line(card, hip, knee, Colors.TEXT_DARK, 8, lineType=cv2.LINE_8)
+            cv2.line(card, knee, ankle, Colors.TEXT_DARK, 8, lineType=cv2.LINE_8)
+            cv2.circle(card, knee, 12, Colors.PRIMARY, -1, lineType=cv2.LINE_8)
             
         elif illust_type == "release":
             # Draw release point
@@ -477,13 +694,13 @@ class ProTipCard:
             hand = (cx + 30, cy - 70)
             ball = (cx + 40, cy - 90)
             
-            cv2.line(card, body_base, shoulder, Colors.TEXT_DARK, 8)
-            cv2.line(card, shoulder, hand, Colors.TEXT_DARK, 8)
-            cv2.circle(card, ball, 20, Colors.PRIMARY, -1)
+            cv2.line(card, body_base, shoulder, Colors.TEXT_DARK, 8, lineType=cv2.LINE_8)
+            cv2.line(card, shoulder, hand, Colors.TEXT_DARK, 8, lineType=cv2.LINE_8)
+            cv2.circle(card, ball, 20, Colors.PRIMARY, -1, lineType=cv2.LINE_8)
             
             # Arrow showing upward release
             cv2.arrowedLine(card, (cx + 60, cy - 40), (cx + 60, cy - 100),
-                           Colors.GOOD, 3, tipLength=0.3)
+                           Colors.GOOD, 3, tipLength=0.3, line_type=cv2.LINE_8)
             
         elif illust_type == "follow_through":
             # Draw gooseneck follow through
@@ -492,12 +709,12 @@ class ProTipCard:
             wrist = (cx + 50, cy - 60)
             fingers = (cx + 60, cy - 30)
             
-            cv2.line(card, shoulder, elbow, Colors.TEXT_DARK, 8)
-            cv2.line(card, elbow, wrist, Colors.TEXT_DARK, 8)
-            cv2.line(card, wrist, fingers, Colors.TEXT_DARK, 6)
+            cv2.line(card, shoulder, elbow, Colors.TEXT_DARK, 8, lineType=cv2.LINE_8)
+            cv2.line(card, elbow, wrist, Colors.TEXT_DARK, 8, lineType=cv2.LINE_8)
+            cv2.line(card, wrist, fingers, Colors.TEXT_DARK, 6, lineType=cv2.LINE_8)
             
             # "Gooseneck" curve
-            cv2.ellipse(card, wrist, (15, 15), 0, 0, 120, Colors.PRIMARY, 3)
+            cv2.ellipse(card, wrist, (15, 15), 0, 0, 120, Colors.PRIMARY, 3, lineType=cv2.LINE_8)
 
 
 # =============================================================================
@@ -507,8 +724,8 @@ class ProTipCard:
 class ShotBreakdown:
     """Creates multi-frame breakdown of a shot."""
     
-    def __init__(self):
-        self.annotator = FrameAnnotator()
+    def __init__(self, annotator: FrameAnnotator = None):
+        self.annotator = annotator or _DEFAULT_ANNOTATOR
     
     def create_breakdown(self, frames: List[Tuple[str, np.ndarray]],
                          landmarks_list: List[Dict],
@@ -524,35 +741,17 @@ class ShotBreakdown:
         """
         # Select key frames: Load, Release, Follow-through
         key_indices = [1, 5, 6]  # Based on 7-frame capture
-        key_frames = []
+        phases = ["load", "release", "follow_through"]
         
-        for i, idx in enumerate(key_indices):
+        # Key frames are independent, so render them concurrently
+        # (the annotator only holds config)
+        futures = []
+        for idx, phase in zip(key_indices, phases):
             if idx < len(frames):
                 label, frame = frames[idx]
                 lm = landmarks_list[idx] if idx < len(landmarks_list) else {}
-                
-                # Determine phase
-                if i == 0:
-                    phase = "load"
-                elif i == 1:
-                    phase = "release"
-                else:
-                    phase = "follow_through"
-                
-                # Annotate
-                annotated = self.annotator.annotate_shot_frame(frame, lm, metrics, phase)
-                
-                # Resize for layout
-                h, w = annotated.shape[:2]
-                target_h = 300
-                scale = target_h / h
-                resized = cv2.resize(annotated, (int(w * scale), target_h))
-                
-                # Add phase label
-                cv2.putText(resized, phase.replace("_", " ").upper(), (10, 25),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, Colors.PRIMARY, 2)
-                
-                key_frames.append(resized)
+                futures.append(_RENDER_POOL.submit(self._render_key, frame, lm, metrics, phase))
+        key_frames = [f.result() for f in futures]
         
         # Combine horizontally
         if key_frames:
@@ -576,14 +775,32 @@ class ShotBreakdown:
         
         return np.zeros((300, 800, 3), dtype=np.uint8)
     
+    def _render_key(self, frame: np.ndarray, landmarks: Dict, metrics: Dict,
+                    phase: str) -> np.ndarray:
+        """Annotate, resize and label one key frame of the breakdown."""
+        # Annotate
+        annotated = self.annotator.annotate_shot_frame(frame, landmarks, metrics, phase)
+        
+        # Resize for layout
+        h, w = annotated.shape[:2]
+        target_h = 300
+        scale = target_h / h
+        resized = cv2.resize(annotated, (int(w * scale), target_h))
+        
+        # Add phase label
+        cv2.putText(resized, phase.replace("_", " ").upper(), (10, 25),
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, Colors.PRIMARY, 2, lineType=cv2.LINE_AA)
+        
+        return resized
+    
     def _create_issues_panel(self, width: int, issues: List[Dict]) -> np.ndarray:
         """Create panel showing issues to work on."""
         height = 80 + 25 * min(len(issues), 3)
-        panel = np.ones((height, width, 3), dtype=np.uint8) * 30
+        panel = np.full((height, width, 3), 30, dtype=np.uint8)
         
         # Header
         cv2.putText(panel, "AREAS TO IMPROVE", (20, 30),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, Colors.WARNING, 2)
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, Colors.WARNING, 2, lineType=cv2.LINE_AA)
         
         # Issues
         y = 60
@@ -591,9 +808,9 @@ class ShotBreakdown:
             severity = issue.get("severity", "warning")
             color = Colors.BAD if severity == "error" else Colors.WARNING
             
-            cv2.circle(panel, (30, y - 5), 5, color, -1)
+            cv2.circle(panel, (30, y - 5), 5, color, -1, lineType=cv2.LINE_8)
             cv2.putText(panel, issue.get("message", ""), (45, y),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, Colors.TEXT_LIGHT, 1)
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, Colors.TEXT_LIGHT, 1, lineType=cv2.LINE_AA)
             y += 25
         
         return panel
@@ -610,11 +827,104 @@ class LiveFeedbackOverlay:
         self.current_feedback = None
         self.feedback_start_time = 0
         self.feedback_duration = 5.0  # seconds
+        
+        # Text layout, computed once per feedback in set_feedback
+        self._indicator_color = None
+        self._result_text = ""
+        self._result_color = Colors.NEUTRAL
+        self._rating_text = None
+        self._feedback_lines = []
+        self._cue_layout = None  # (cue_text, text_width)
+        
+        # Pre-rendered card for the current feedback and frame size
+        self._card_key = None
+        self._card_bg = None  # Background + result stripe, blended each frame
+        self._text_layer = None  # Full-width strip of text pixels, stamped opaque
+        self._text_mask = None
     
     def set_feedback(self, feedback: Dict, timestamp: float):
         """Set current feedback to display."""
         self.current_feedback = feedback
         self.feedback_start_time = timestamp
+        feedback = feedback or {}
+        
+        # Result indicator
+        made = feedback.get("made")
+        if made is True:
+            self._indicator_color = Colors.GOOD
+            self._result_text = "MADE"
+            self._result_color = Colors.GOOD
+        elif made is False:
+            miss_type = feedback.get("miss_type", "")
+            self._indicator_color = Colors.BAD
+            self._result_text = f"MISSED ({miss_type})" if miss_type else "MISSED"
+            self._result_color = Colors.BAD
+        else:
+            self._indicator_color = None
+            self._result_text = ""
+            self._result_color = Colors.NEUTRAL
+        
+        rating = feedback.get("form_rating")
+        self._rating_text = f"Form: {rating}/10" if rating else None
+        
+        # Main feedback, wrapped at word boundaries (two lines max)
+        self._feedback_lines = textwrap.wrap(feedback.get("feedback") or "", width=60)[:2]
+        
+        quick_cue = feedback.get("quick_cue")
+        self._cue_layout = None
+        if quick_cue:
+            cue_text = f'"{quick_cue}"'
+            (tw, _), _ = _text_size(cue_text, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)
+            self._cue_layout = (cue_text, tw)
+        
+        self._card_key = None
+    
+    def _build_card(self, w: int, card_y: int, card_h: int, y0: int,
+                    roi_shape: Tuple[int, ...], strip_shape: Tuple[int, ...]):
+        """Render the card background and text layer for this frame size."""
+        # Card background
+        bg = np.empty(roi_shape, dtype=np.uint8)
+        bg[:] = Colors.BACKGROUND
+        
+        # Result indicator
+        if self._indicator_color:
+            cv2.rectangle(bg, (0, card_y - y0), (10, card_y - y0 + card_h),
+                         self._indicator_color, -1, lineType=cv2.LINE_8)
+        
+        # Text is drawn once into a layer plus coverage mask. It stays LINE_8:
+        # without AA putText only writes whole pixels, so stamping the layer
+        # matches drawing directly onto the blended frame.
+        layer = np.zeros(strip_shape, dtype=np.uint8)
+        mask = np.zeros(strip_shape[:2], dtype=np.uint8)
+        
+        def text(s, org, scale, color, thickness):
+            org = (org[0], org[1] - y0)
+            cv2.putText(layer, s, org, cv2.FONT_HERSHEY_SIMPLEX, scale, color, thickness,
+                       lineType=cv2.LINE_8)
+            cv2.putText(mask, s, org, cv2.FONT_HERSHEY_SIMPLEX, scale, 255, thickness,
+                       lineType=cv2.LINE_8)
+        
+        if self._result_text:
+            text(self._result_text, (45, card_y + 30), 0.7, self._result_color, 2)
+        
+        # Form rating
+        if self._rating_text:
+            text(self._rating_text, (45, card_y + 55), 0.5, Colors.TEXT_LIGHT, 1)
+        
+        # Main feedback
+        y = card_y + 80
+        for line in self._feedback_lines:
+            text(line, (45, y), 0.5, Colors.TEXT_LIGHT, 1)
+            y += 20
+        
+        # Quick cue
+        if self._cue_layout:
+            cue_text, tw = self._cue_layout
+            text(cue_text, (w - tw - 40, card_y + 30), 0.6, Colors.PRIMARY, 2)
+        
+        self._card_bg = bg
+        self._text_layer = layer
+        self._text_mask = mask.astype(bool)[..., None]
     
     def draw(self, frame: np.ndarray, current_time: float) -> np.ndarray:
         """Draw feedback overlay on frame."""
@@ -635,62 +945,19 @@ class LiveFeedbackOverlay:
         card_h = 120
         card_y = h - card_h - 20
         
-        overlay = frame.copy()
-        
-        # Card background
-        cv2.rectangle(overlay, (20, card_y), (w - 20, card_y + card_h),
-                     Colors.BACKGROUND, -1)
-        
-        # Result indicator
-        made = self.current_feedback.get("made")
-        if made is True:
-            cv2.rectangle(overlay, (20, card_y), (30, card_y + card_h),
-                         Colors.GOOD, -1)
-            result_text = "MADE"
-            result_color = Colors.GOOD
-        elif made is False:
-            cv2.rectangle(overlay, (20, card_y), (30, card_y + card_h),
-                         Colors.BAD, -1)
-            miss_type = self.current_feedback.get("miss_type", "")
-            result_text = f"MISSED ({miss_type})" if miss_type else "MISSED"
-            result_color = Colors.BAD
-        else:
-            result_text = ""
-            result_color = Colors.NEUTRAL
+        # Only the card rows are touched (rectangle corners are inclusive)
+        y0 = max(card_y, 0)
+        strip = frame[y0:card_y + card_h + 1]
+        roi = strip[:, 20:w - 19]
         
-        # Blend
-        cv2.addWeighted(overlay, alpha * 0.9, frame, 1 - alpha * 0.9, 0, frame)
-        
-        # Text
-        if result_text:
-            cv2.putText(frame, result_text, (45, card_y + 30),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, result_color, 2)
-        
-        # Form rating
-        rating = self.current_feedback.get("form_rating")
-        if rating:
-            cv2.putText(frame, f"Form: {rating}/10", (45, card_y + 55),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, Colors.TEXT_LIGHT, 1)
-        
-        # Main feedback
-        feedback_text = self.current_feedback.get("feedback", "")
-        if feedback_text:
-            # Wrap text
-            max_chars = 60
-            lines = [feedback_text[i:i+max_chars] for i in range(0, len(feedback_text), max_chars)]
-            y = card_y + 80
-            for line in lines[:2]:
-                cv2.putText(frame, line, (45, y),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.5, Colors.TEXT_LIGHT, 1)
-                y += 20
+        if self._card_key != (w, h):
+            self._build_card(w, card_y, card_h, y0, roi.shape, strip.shape)
+            self._card_key = (w, h)
         
-        # Quick cue
-        quick_cue = self.current_feedback.get("quick_cue")
-        if quick_cue:
-            cue_text = f'"{quick_cue}"'
-            (tw, th), _ = cv2.getTextSize(cue_text, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)
-            cv2.putText(frame, cue_text, (w - tw - 40, card_y + 30),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, Colors.PRIMARY, 2)
+        # Blend the background, then stamp the text at full opacity
+        if roi.size:
+            roi[:] = cv2.addWeighted(self._card_bg, alpha * 0.9, roi, 1 - alpha * 0.9, 0)
+        np.copyto(strip, self._text_layer, where=self._text_mask)
         
         return frame
 
@@ -699,36 +966,95 @@ class LiveFeedbackOverlay:
 # Export Functions
 # =============================================================================
 
-def save_annotated_shot(output_path: str, frame: np.ndarray, landmarks: Dict,
-                        metrics: Dict, feedback: Dict = None):
-    """Save an annotated shot image."""
-    annotator = FrameAnnotator()
-    annotated = annotator.annotate_shot_frame(frame, landmarks, metrics, "release")
+JPEG_QUALITY = 85  # Background (*_async) writers; the sync ones keep OpenCV's default 95
+_JPEG_PARAMS = [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY]
+
+# Background writers - JPEG encoding releases the GIL, so saves overlap analysis
+_WRITER_POOL = ThreadPoolExecutor(max_workers=2)
+
+
+def _write_image(output_path: str, image: np.ndarray, jpeg_params: List[int] = None) -> str:
+    """Encode and write an image, applying jpeg_params to .jpg/.jpeg paths."""
+    is_jpeg = output_path.lower().endswith((".jpg", ".jpeg"))
+    cv2.imwrite(output_path, image, jpeg_params if jpeg_params and is_jpeg else [])
+    return output_path
+
+
+def _do_save(output_path: str, frame: np.ndarray, landmarks: Dict,
+             metrics: Dict, feedback: Dict = None, jpeg_params: List[int] = None) -> str:
+    """Annotate the release frame, add the feedback bar and write it."""
+    annotated = _DEFAULT_ANNOTATOR.annotate_shot_frame(frame, landmarks, metrics, "release")
     
     if feedback:
         # Add feedback text at bottom
         h, w = annotated.shape[:2]
-        cv2.rectangle(annotated, (0, h - 60), (w, h), (0, 0, 0), -1)
+        cv2.rectangle(annotated, (0, h - 60), (w, h), (0, 0, 0), -1, lineType=cv2.LINE_8)
         cv2.putText(annotated, feedback.get("feedback", ""), (10, h - 25),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, Colors.TEXT_LIGHT, 1)
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, Colors.TEXT_LIGHT, 1, lineType=cv2.LINE_AA)
     
-    cv2.imwrite(output_path, annotated)
-    return output_path
+    return _write_image(output_path, annotated, jpeg_params)
 
 
-def generate_session_report(output_dir: str, shots: List[Dict]) -> str:
-    """Generate a visual report of a shooting session."""
+def save_annotated_shot(output_path: str, frame: np.ndarray, landmarks: Dict,
+                        metrics: Dict, feedback: Dict = None) -> str:
+    """Save an annotated shot image."""
+    return _do_save(output_path, frame, landmarks, metrics, feedback)
+
+
+def save_annotated_shot_async(output_path: str, frame: np.ndarray, landmarks: Dict,
+                              metrics: Dict, feedback: Dict = None) -> Future:
+    """Annotate and save a shot image on a background writer thread.
+    
+    The frame must not be modified until the returned future completes.
+    Its result is the output path. JPEGs are written at JPEG_QUALITY.
+    """
+    return _WRITER_POOL.submit(_do_save, output_path, frame, landmarks, metrics, feedback,
+                               _JPEG_PARAMS)
+
+
+REPORT_THUMB_SIZE = (180, 135)  # (w, h) of each shot thumbnail in the report grid
+REPORT_GRID_COLS = 6
+
+
+def _render_shot_thumbnail(shot: Dict) -> np.ndarray:
+    """Render one report thumbnail.
+    
+    shot: dict with "frame" (BGR release frame) and optionally "landmarks",
+    "metrics", "made" and "number".
+    """
+    frame = shot["frame"]
+    if shot.get("landmarks"):
+        frame = _DEFAULT_ANNOTATOR.annotate_shot_frame(
+            frame, shot["landmarks"], shot.get("metrics", {}), "release"
+        )
+    
+    thumb_w, thumb_h = REPORT_THUMB_SIZE
+    thumb = cv2.resize(frame, (thumb_w, thumb_h), interpolation=cv2.INTER_AREA)
+    
+    # Result border and shot number
+    made = shot.get("made")
+    color = Colors.GOOD if made else (Colors.BAD if made is False else Colors.NEUTRAL)
+    cv2.rectangle(thumb, (0, 0), (thumb_w - 1, thumb_h - 1), color, 3, lineType=cv2.LINE_8)
+    if shot.get("number") is not None:
+        cv2.putText(thumb, f"#{shot['number']}", (8, thumb_h - 10),
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, Colors.TEXT_LIGHT, 2, lineType=cv2.LINE_AA)
+    
+    return thumb
+
+
+def _render_session_report(output_dir: str, shots: List[Dict]) -> Tuple[str, np.ndarray]:
+    """Render the session report image, returning (report path, image)."""
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
     
     # Create summary image
     summary_h, summary_w = 800, 1200
-    summary = np.ones((summary_h, summary_w, 3), dtype=np.uint8) * 255
+    summary = np.full((summary_h, summary_w, 3), 255, dtype=np.uint8)
     
     # Header
-    cv2.rectangle(summary, (0, 0), (summary_w, 80), Colors.PRIMARY, -1)
+    cv2.rectangle(summary, (0, 0), (summary_w, 80), Colors.PRIMARY, -1, lineType=cv2.LINE_8)
     cv2.putText(summary, "SESSION REPORT", (20, 55),
-               cv2.FONT_HERSHEY_SIMPLEX, 1.5, Colors.TEXT_DARK, 3)
+               cv2.FONT_HERSHEY_SIMPLEX, 1.5, Colors.TEXT_DARK, 3, lineType=cv2.LINE_AA)
     
     # Stats
     total = len(shots)
@@ -736,14 +1062,54 @@ def generate_session_report(output_dir: str, shots: List[Dict]) -> str:
     pct = made / total * 100 if total else 0
     
     cv2.putText(summary, f"Shots: {total}  |  Made: {made}  |  {pct:.0f}%",
-               (20, 130), cv2.FONT_HERSHEY_SIMPLEX, 0.8, Colors.TEXT_DARK, 2)
+               (20, 130), cv2.FONT_HERSHEY_SIMPLEX, 0.8, Colors.TEXT_DARK, 2, lineType=cv2.LINE_AA)
+    
+    # Shot thumbnails - only render as many as fit in the grid
+    thumb_w, thumb_h = REPORT_THUMB_SIZE
+    gap, grid_x, grid_y = 12, 30, 160
+    rows = (summary_h - grid_y - gap) // (thumb_h + gap)
+    with_frames = [s for s in shots if s.get("frame") is not None]
+    to_render = with_frames[:rows * REPORT_GRID_COLS]
+    
+    # Thumbnails render on threads: frames are shared rather than pickled, and
+    # forking a process that already runs writer/Gemini/viz threads is unsafe
+    thumbs = list(_RENDER_POOL.map(_render_shot_thumbnail, to_render))
     
-    # TODO: Add shot thumbnails, charts, etc.
+    for i, thumb in enumerate(thumbs):
+        row, col = divmod(i, REPORT_GRID_COLS)
+        x = grid_x + col * (thumb_w + gap)
+        y = grid_y + row * (thumb_h + gap)
+        summary[y:y + thumb_h, x:x + thumb_w] = thumb
+    
+    if len(with_frames) > len(to_render):
+        cv2.putText(summary, f"+{len(with_frames) - len(to_render)} more shots",
+                   (grid_x, summary_h - 15), cv2.FONT_HERSHEY_SIMPLEX, 0.6, Colors.SECONDARY, 1,
+                   lineType=cv2.LINE_AA)
+    
+    # TODO: Add charts, etc.
     
     report_path = output_path / "session_report.jpg"
-    cv2.imwrite(str(report_path), summary)
     
-    return str(report_path)
+    return str(report_path), summary
+
+
+def generate_session_report(output_dir: str, shots: List[Dict]) -> str:
+    """Generate a visual report of a shooting session.
+    
+    Shots carrying a "frame" get a thumbnail in the report grid (see
+    _render_shot_thumbnail), rendered concurrently on the shared render pool.
+    """
+    return _write_image(*_render_session_report(output_dir, shots))
+
+
+def generate_session_report_async(output_dir: str, shots: List[Dict]) -> Future:
+    """Render the session report, then write it on a background writer thread.
+    
+    The returned future's result is the report path. JPEGs are written at
+    JPEG_QUALITY.
+    """
+    return _WRITER_POOL.submit(_write_image, *_render_session_report(output_dir, shots),
+                               _JPEG_PARAMS)
 
 
 # =============================================================================
@@ -766,7 +1132,7 @@ if __name__ == "__main__":
     print("Created test tip card: /tmp/test_tip_card.jpg")
     
     # Test with dummy data
-    dummy_frame = np.ones((480, 640, 3), dtype=np.uint8) * 100
+    dummy_frame = np.full((480, 640, 3), 100, dtype=np.uint8)
     dummy_landmarks = {
         "right_shoulder": (0.4, 0.3),
         "right_elbow": (0.45, 0.45),
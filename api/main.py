@@ -4,19 +4,56 @@ FormCheck API - Multi-shot video analysis
 Processes ALL shots in a video and returns session summary
 """
 
+import asyncio
 import os
 import sys
+import time
 from pathlib import Path
 from typing import Optional, List
 import uvicorn
 from fastapi import FastAPI, UploadFile, File, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 from dotenv import load_dotenv
 import tempfile
 import json
-import base64
+from base64 import b64encode
+import cv2
+import numpy as np
+import queue
+import re
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+
+# Faster JSON for LLM replies and streamed results when orjson is installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+# libjpeg-turbo encodes shot frames faster than cv2.imencode when available
+try:
+    from turbojpeg import TurboJPEG
+    _TJ = TurboJPEG()
+except (ImportError, RuntimeError, OSError):
+    # RuntimeError: binding installed but libturbojpeg not found; OSError: it failed to load
+    _TJ = None
+
+
+def _jpeg_encode(img, quality: int) -> bytes:
+    """JPEG-encode a BGR frame with TurboJPEG, falling back to OpenCV."""
+    if _TJ is not None:
+        return _TJ.encode(img, quality=quality)
+    params = _JPEG_PARAMS.get(quality) or [cv2.IMWRITE_JPEG_QUALITY, quality]
+    _, buffer = cv2.imencode('.jpg', img, params)
+    return buffer.tobytes()
 
 # Load environment variables
 load_dotenv()
@@ -30,8 +67,12 @@ try:
     from live_analysis import (
         PoseDetector, 
         LiveShotDetector, 
+        FrameProducer,
+        decode_frames,
+        detect_poses,
+        detect_shots_in_range,
+        probe_video,
         GeminiClient, 
-        PlayerProfile,
         ShotEvent,
         LiveState
     )
@@ -41,11 +82,33 @@ except ImportError as e:
     print(f"⚠️  Warning: Could not import core modules: {e}")
     MODULES_AVAILABLE = False
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Load shared models once at startup instead of on every request."""
+    global GEMINI_MODEL
+    
+    # Pre-warmed pose detectors, checked out per request
+    app.state.pose_pool = queue.Queue()
+    if MODULES_AVAILABLE:
+        for _ in range(POSE_POOL_SIZE):
+            app.state.pose_pool.put(PoseDetector())
+    
+    if GEMINI_API_KEY:
+        import google.generativeai as genai
+        genai.configure(api_key=GEMINI_API_KEY)
+        GEMINI_MODEL = genai.GenerativeModel("gemini-2.0-flash")
+    
+    yield
+    
+    while not app.state.pose_pool.empty():
+        app.state.pose_pool.get_nowait().close()
+
 # Initialize FastAPI
 app = FastAPI(
     title="FormCheck API",
     description="Multi-shot basketball analysis API",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -59,8 +122,47 @@ app.add_middleware(
 
 # Initialize components
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
+ANALYSIS_FPS = 10  # Frames per second decoded and run through pose detection
+POSE_INPUT_WIDTH = 640  # Frames are downscaled to this width for pose detection
+UPLOAD_CHUNK_SIZE = 1 << 20  # Uploads are streamed to disk in 1 MB chunks
+GEMINI_CONCURRENCY = 8  # Shot analyses in flight at once (Gemini rate limits)
+GEMINI_FRAME_WIDTH = 512  # Shot frames are downscaled to this width for Gemini
+THUMBNAIL_WIDTH = 200  # Release-frame preview returned with each shot
+GEMINI_JPEG_QUALITY = 75  # JPEG quality of the frames sent to Gemini
+THUMBNAIL_JPEG_QUALITY = 70  # JPEG quality of the response thumbnails
+# OpenCV encode params per quality, built once rather than per frame
+_JPEG_PARAMS = {q: [cv2.IMWRITE_JPEG_QUALITY, q] for q in (GEMINI_JPEG_QUALITY, THUMBNAIL_JPEG_QUALITY)}
+ENCODE_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())  # Shared JPEG encoders
+SCAN_CHUNK_SECONDS = 30  # Videos at least two chunks long are scanned in parallel processes
+SCAN_WARMUP_SECONDS = 4  # Each chunk re-reads this much of the previous one to prime detection
+SCAN_WORKERS = os.cpu_count() or 1
+MAX_CONCURRENT_ANALYSES = int(os.getenv("MAX_CONCURRENT_ANALYSES", 2))  # Videos decoded + pose-scanned at once
+MAX_QUEUED_ANALYSES = int(os.getenv("MAX_QUEUED_ANALYSES", 8))  # Waiting beyond that get a 429
+_ANALYZE_SEM = asyncio.Semaphore(MAX_CONCURRENT_ANALYSES)
+_pending_analyses = 0  # Admitted requests that haven't finished scanning
+POSE_POOL_SIZE = MAX_CONCURRENT_ANALYSES  # PoseDetectors loaded at startup, one per concurrent scan
+GEMINI_MODEL = None  # Shared GenerativeModel, created at startup
 db = FormCheckDB() if MODULES_AVAILABLE else None
 
+# Contents of the first ``` / ```json fence in an LLM reply (closing fence optional)
+_FENCE_RE = re.compile(r'```(?:json)?\s*(.*?)(?:```|\Z)', re.S)
+
+
+def _parse_llm_json(text: str):
+    """Parse JSON from an LLM reply, trying bare JSON before looking for a fence."""
+    try:
+        return _json_loads(text)
+    except json.JSONDecodeError:  # orjson's error subclasses this
+        pass
+    m = _FENCE_RE.search(text)
+    return _json_loads(m.group(1)) if m else _json_loads(text.strip('` \n'))
+
+
+def _json_line(obj) -> bytes:
+    """Serialize one line of an NDJSON stream."""
+    return _json_dumps(obj) + b"\n"
+
+
 # Models
 class ShotFrame(BaseModel):
     """Individual frame from shot analysis"""
@@ -111,127 +213,139 @@ async def health_check():
         database_available=db is not None
     )
 
-# Analyze entire video with multiple shots
-@app.post("/analyze", response_model=SessionSummary)
-async def analyze_video(
-    background_tasks: BackgroundTasks,
-    file: UploadFile = File(...),
-    shooting_side: str = "right",
-    player_id: Optional[int] = None
-):
-    """
-    Analyze ALL shots in a video.
+# Analysis pipeline shared by /analyze and /analyze/stream
+
+async def _save_upload(file: UploadFile) -> str:
+    """Stream an upload to a temp file and return its path."""
+    suffix = Path(file.filename).suffix if file.filename else ".mp4"
+    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
+    bytes_written = 0
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        temp_file.write(chunk)
+        bytes_written += len(chunk)
+    temp_file.close()
     
-    Returns session summary with:
-    - All detected shots
-    - Makes/misses count
-    - Session-level feedback
-    - Drill suggestions
-    """
-    if not MODULES_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Analysis modules not available")
+    print(f"\n{'='*60}")
+    print(f"📹 Processing video: {file.filename} ({bytes_written} bytes)")
+    print(f"{'='*60}\n")
     
-    if not GEMINI_API_KEY:
-        raise HTTPException(status_code=503, detail="GEMINI_API_KEY not configured")
+    return temp_file.name
+
+async def _scan_video(video_path: str, shooting_side: str) -> list:
+    """Find ALL shots in a video (raises 400 if it can't be opened, 404 if none)."""
+    video_info = probe_video(video_path)
     
-    try:
-        # Save uploaded file
-        suffix = Path(file.filename).suffix if file.filename else ".mp4"
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
-        content = await file.read()
-        temp_file.write(content)
-        temp_file.close()
-        video_path = temp_file.name
-        
-        print(f"\n{'='*60}")
-        print(f"📹 Processing video: {file.filename} ({len(content)} bytes)")
-        print(f"{'='*60}\n")
-        
-        # Initialize components
-        pose = PoseDetector()
-        shot_detector = LiveShotDetector(shooting_side)
+    if video_info is None:
+        raise HTTPException(status_code=400, detail="Could not open video file")
+    
+    fps, total_frames = video_info
+    
+    # Shot detection doesn't need every frame - skipped frames aren't converted
+    stride = max(1, int(round(fps / ANALYSIS_FPS)))
+    
+    detected_shots = []
+    
+    print(f"🎬 Video info: {total_frames} frames @ {fps:.1f} fps")
+    print(f"⏱️  Duration: {total_frames/fps:.1f} seconds")
+    
+    # Long videos are split into frame ranges scanned by parallel processes
+    chunk_frames = int(fps * SCAN_CHUNK_SECONDS)
+    n_chunks = min(SCAN_WORKERS, total_frames // chunk_frames) if chunk_frames else 0
+    
+    if n_chunks >= 2:
+        print(f"🔍 Scanning for shots in {n_chunks} parallel chunks...\n")
         
-        # Get player profile
-        player_profile = PlayerProfile()
-        if player_id and db:
-            player = db.get_player(player_id)
-            if player:
-                player_profile = PlayerProfile(
-                    skill_level=player.skill_level,
-                    working_on=player.working_on or "",
-                    limitations=player.limitations or "",
-                    height_inches=player.height_inches
+        # The last range runs to EOF - container frame counts are estimates
+        bounds = [total_frames * i // n_chunks for i in range(n_chunks)] + [None]
+        loop = asyncio.get_running_loop()
+        # spawn: forking a process that owns threads and MediaPipe graphs is unsafe
+        with ProcessPoolExecutor(max_workers=n_chunks,
+                                 mp_context=multiprocessing.get_context("spawn")) as pool:
+            chunk_shots = await asyncio.gather(*[
+                loop.run_in_executor(
+                    pool, detect_shots_in_range, video_path, bounds[i], bounds[i + 1],
+                    shooting_side, stride, fps, int(fps * SCAN_WARMUP_SECONDS),
+                    POSE_INPUT_WIDTH
                 )
+                for i in range(n_chunks)
+            ])
         
-        # Process video to find ALL shots
-        import cv2
-        cap = cv2.VideoCapture(video_path)
-        
-        if not cap.isOpened():
-            raise HTTPException(status_code=400, detail="Could not open video file")
-        
-        fps = cap.get(cv2.CAP_PROP_FPS) or 30
-        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-        
-        detected_shots = []
-        frame_count = 0
-        
-        print(f"🎬 Video info: {total_frames} frames @ {fps:.1f} fps")
-        print(f"⏱️  Duration: {total_frames/fps:.1f} seconds")
+        for shot in (shot for shots in chunk_shots for shot in shots):
+            shot.shot_number = len(detected_shots) + 1
+            detected_shots.append(shot)
+            print(f"✓ Shot #{shot.shot_number} detected at frame {shot.frame_index}")
+            print(f"   Elbow: {shot.elbow_angle_load:.0f}° → {shot.elbow_angle_release:.0f}°")
+    else:
         print(f"🔍 Scanning for shots...\n")
-        
-        # Process ALL frames to find ALL shots
-        while True:
-            ret, frame = cap.read()
-            if not ret:
-                break
-            
-            frame_count += 1
+        pose = await asyncio.to_thread(app.state.pose_pool.get)
+        try:
+            # Blocking decode + pose loop - keep it off the event loop
+            detected_shots = await asyncio.to_thread(
+                _scan_serial, pose, video_path, shooting_side, stride, fps, total_frames
+            )
+        finally:
+            app.state.pose_pool.put(pose)
+    
+    if not detected_shots:
+        raise HTTPException(
+            status_code=404,
+            detail="No shots detected. Make sure video shows clear shooting motions with full body visible."
+        )
+    
+    print(f"\n{'='*60}")
+    print(f"🎯 Found {len(detected_shots)} shot(s) - Analyzing with Gemini...")
+    print(f"{'='*60}\n")
+    
+    return detected_shots
+
+def _scan_serial(pose, video_path: str, shooting_side: str, stride: int,
+                 fps: float, total_frames: int) -> list:
+    """Scan a whole video for shots on this thread with a checked-out PoseDetector."""
+    shot_detector = LiveShotDetector(shooting_side, frame_stride=stride)
+    detected_shots = []
+    
+    # Every stride-th frame is decoded on a background thread while pose
+    # detection runs here
+    pose.reset()
+    producer = FrameProducer(decode_frames(video_path, stride)).start()
+    next_progress = 100
+    try:
+        # Pose runs on a downscaled copy, one frame ahead of shot detection;
+        # the full-resolution frame is kept for the shot's Gemini frames
+        frames = iter(producer.queue.get, None)
+        for frame_count, frame, landmarks, visibility in detect_poses(
+                pose, frames, fps, POSE_INPUT_WIDTH):
             
             # Show progress every 100 frames
-            if frame_count % 100 == 0:
-                progress = (frame_count / total_frames) * 100
+            if frame_count >= next_progress:
+                next_progress += 100
+                progress = (frame_count / total_frames) * 100 if total_frames else 0
                 print(f"   Processing: {progress:.0f}% ({frame_count}/{total_frames} frames)")
             
-            # Detect pose
-            landmarks, visibility = pose.detect(frame)
-            
             # Detect shot
-            shot = shot_detector.update(frame, landmarks, visibility)
+            shot = shot_detector.update(frame, landmarks, visibility, frame_index=frame_count)
             if shot:
                 shot.shot_number = len(detected_shots) + 1
                 detected_shots.append(shot)
                 print(f"\n✓ Shot #{shot.shot_number} detected at frame {frame_count}")
                 print(f"   Elbow: {shot.elbow_angle_load:.0f}° → {shot.elbow_angle_release:.0f}°\n")
-        
-        cap.release()
-        pose.close()
-        
-        # Cleanup temp file
-        background_tasks.add_task(os.unlink, video_path)
-        
-        if not detected_shots:
-            raise HTTPException(
-                status_code=404,
-                detail="No shots detected. Make sure video shows clear shooting motions with full body visible."
-            )
-        
-        print(f"\n{'='*60}")
-        print(f"🎯 Found {len(detected_shots)} shot(s) - Analyzing with Gemini...")
-        print(f"{'='*60}\n")
-        
-        # Analyze each shot with Gemini
-        import google.generativeai as genai
-        genai.configure(api_key=GEMINI_API_KEY)
-        model = genai.GenerativeModel("gemini-2.0-flash")
-        
-        analyzed_shots = []
-        
-        for idx, shot_event in enumerate(detected_shots, 1):
-            print(f"🤖 Analyzing shot {idx}/{len(detected_shots)}...")
-            
-            # Build prompt for individual shot
-            prompt = f"""You are analyzing shot #{idx} from a basketball practice session.
+    finally:
+        producer.stop()
+    
+    return detected_shots
+
+def _encode_frame(frame_img) -> bytes:
+    # Gemini downsizes images itself - don't ship full resolution
+    h, w = frame_img.shape[:2]
+    if w > GEMINI_FRAME_WIDTH:
+        frame_img = cv2.resize(frame_img, (GEMINI_FRAME_WIDTH, int(h * GEMINI_FRAME_WIDTH / w)),
+                               interpolation=cv2.INTER_AREA)
+    # Raw JPEG bytes - the SDK base64-encodes blobs itself when serializing
+    return _jpeg_encode(frame_img, GEMINI_JPEG_QUALITY)
+
+def _build_shot_content(shot_event, idx: int) -> list:
+    # Build prompt for individual shot
+    prompt = f"""You are analyzing shot #{idx} from a basketball practice session.
 
 Shot metrics:
 - Elbow at load: {shot_event.elbow_angle_load:.0f}°
@@ -249,74 +363,98 @@ Provide BRIEF analysis in JSON:
     "quick_cue": "2-4 word cue"
 }}
 """
-            
-            # Encode frames
-            content_for_gemini = [prompt]
-            for label, frame_img in shot_event.frames:
-                _, buffer = cv2.imencode('.jpg', frame_img, [cv2.IMWRITE_JPEG_QUALITY, 85])
-                b64 = base64.b64encode(buffer).decode('utf-8')
-                content_for_gemini.append({
-                    "mime_type": "image/jpeg",
-                    "data": b64
-                })
-            
-            # Get Gemini response
-            response = model.generate_content(content_for_gemini)
-            text = response.text.strip()
-            
-            # Parse JSON
-            if "```json" in text:
-                text = text.split("```json")[1].split("```")[0]
-            elif "```" in text:
-                text = text.split("```")[1].split("```")[0]
-            
-            result = json.loads(text)
-            
-            # Create thumbnail from release frame (frame index 6)
-            release_frame = shot_event.frames[6][1] if len(shot_event.frames) > 6 else shot_event.frames[-1][1]
-            height, width = release_frame.shape[:2]
-            target_height = 200
-            target_width = int(width * (target_height / height))
-            resized = cv2.resize(release_frame, (target_width, target_height))
-            _, buffer = cv2.imencode('.jpg', resized, [cv2.IMWRITE_JPEG_QUALITY, 80])
-            thumbnail_b64 = base64.b64encode(buffer).decode('utf-8')
-            
-            # Add to results
-            analyzed_shots.append(ShotAnalysis(
-                shot_number=shot_event.shot_number,
-                made=result.get("made"),
-                miss_type=result.get("miss_type"),
-                form_rating=result.get("form_rating"),
-                feedback=result.get("feedback", ""),
-                key_issue=result.get("key_issue"),
-                quick_cue=result.get("quick_cue"),
-                elbow_angle_load=shot_event.elbow_angle_load,
-                elbow_angle_release=shot_event.elbow_angle_release,
-                wrist_height_release=shot_event.wrist_height_release,
-                knee_bend_load=shot_event.knee_bend_load,
-                thumbnail=thumbnail_b64
-            ))
-            
-            print(f"   ✓ Shot {idx}: {result.get('made', 'unknown')} - {result.get('feedback', '')[:40]}...")
-        
-        # Calculate session stats
-        makes = sum(1 for s in analyzed_shots if s.made)
-        misses = sum(1 for s in analyzed_shots if s.made == False)
-        total = len(analyzed_shots)
-        shooting_pct = (makes / total * 100) if total > 0 else 0
-        
-        ratings = [s.form_rating for s in analyzed_shots if s.form_rating]
-        avg_rating = sum(ratings) / len(ratings) if ratings else 0
-        
-        print(f"\n{'='*60}")
-        print(f"📊 Session Stats: {makes}/{total} made ({shooting_pct:.1f}%)")
-        print(f"⭐ Average form rating: {avg_rating:.1f}/10")
-        print(f"{'='*60}\n")
-        
-        # Generate session-level feedback with Gemini
-        print(f"🤖 Generating session summary...")
-        
-        session_prompt = f"""You analyzed {total} basketball shots. Provide a session summary.
+    
+    # Encode frames in parallel (imencode releases the GIL)
+    encoded = ENCODE_POOL.map(_encode_frame, (fi[1] for fi in shot_event.frames))
+    content_for_gemini = [prompt]
+    for jpeg in encoded:
+        content_for_gemini.append({
+            "mime_type": "image/jpeg",
+            "data": jpeg
+        })
+    return content_for_gemini
+
+def _make_thumbnail(shot_event) -> str:
+    # Create thumbnail from release frame (frame index 6)
+    release_frame = shot_event.frames[6][1] if len(shot_event.frames) > 6 else shot_event.frames[-1][1]
+    thumb_w = THUMBNAIL_WIDTH
+    thumb_h = int(release_frame.shape[0] * thumb_w / release_frame.shape[1])
+    resized = cv2.resize(release_frame, (thumb_w, thumb_h), interpolation=cv2.INTER_AREA)
+    # base64 output is pure ASCII, so skip UTF-8 decoding
+    return b64encode(_jpeg_encode(resized, THUMBNAIL_JPEG_QUALITY)).decode('ascii')
+
+async def _analyze_shot(shot_event, idx: int, total: int,
+                        semaphore: asyncio.Semaphore) -> ShotAnalysis:
+    """Analyze one shot with Gemini (the thumbnail encodes on the pool meanwhile)."""
+    thumbnail = ENCODE_POOL.submit(_make_thumbnail, shot_event)
+    
+    async with semaphore:
+        print(f"🤖 Analyzing shot {idx}/{total}...")
+        response = await asyncio.to_thread(
+            lambda: GEMINI_MODEL.generate_content(_build_shot_content(shot_event, idx))
+        )
+    
+    # Parse JSON
+    result = _parse_llm_json(response.text.strip())
+    
+    analysis = ShotAnalysis(
+        shot_number=shot_event.shot_number,
+        made=result.get("made"),
+        miss_type=result.get("miss_type"),
+        form_rating=result.get("form_rating"),
+        feedback=result.get("feedback", ""),
+        key_issue=result.get("key_issue"),
+        quick_cue=result.get("quick_cue"),
+        elbow_angle_load=shot_event.elbow_angle_load,
+        elbow_angle_release=shot_event.elbow_angle_release,
+        wrist_height_release=shot_event.wrist_height_release,
+        knee_bend_load=shot_event.knee_bend_load,
+        thumbnail=await asyncio.wrap_future(thumbnail)
+    )
+    
+    print(f"   ✓ Shot {idx}: {result.get('made', 'unknown')} - {result.get('feedback', '')[:40]}...")
+    return analysis
+
+class _SessionStats:
+    """Per-shot stats as parallel arrays (filled in any order), reduced once."""
+    
+    def __init__(self, n: int):
+        self.made = np.full(n, -1, dtype=np.int8)  # 1 made, 0 missed, -1 unknown
+        self.rating = np.full(n, np.nan)
+    
+    def record(self, i: int, analysis: ShotAnalysis):
+        # Validated values (pydantic coerces e.g. "true" and "7")
+        if analysis.made is not None:
+            self.made[i] = analysis.made
+        if analysis.form_rating:
+            self.rating[i] = analysis.form_rating
+
+async def _summarize_session(analyzed_shots: List[ShotAnalysis],
+                             stats: _SessionStats) -> SessionSummary:
+    """Compute session stats and get session-level feedback from Gemini.
+    
+    Shots are listed in shot order, whatever order they were analyzed in.
+    """
+    analyzed_shots = sorted(analyzed_shots, key=lambda s: s.shot_number)
+    
+    # Calculate session stats
+    makes = int((stats.made == 1).sum())
+    misses = int((stats.made == 0).sum())
+    total = len(analyzed_shots)
+    shooting_pct = (makes / total * 100) if total > 0 else 0
+    
+    rated = ~np.isnan(stats.rating)
+    avg_rating = float(stats.rating[rated].mean()) if rated.any() else 0
+    
+    print(f"\n{'='*60}")
+    print(f"📊 Session Stats: {makes}/{total} made ({shooting_pct:.1f}%)")
+    print(f"⭐ Average form rating: {avg_rating:.1f}/10")
+    print(f"{'='*60}\n")
+    
+    # Generate session-level feedback with Gemini
+    print(f"🤖 Generating session summary...")
+    
+    session_prompt = f"""You analyzed {total} basketball shots. Provide a session summary.
 
 Stats:
 - Made: {makes}/{total} ({shooting_pct:.1f}%)
@@ -336,30 +474,97 @@ Focus on:
 - Most common issues
 - Specific actionable drills (not generic)
 """
+    
+    summary_response = await asyncio.to_thread(GEMINI_MODEL.generate_content, session_prompt)
+    summary_text = summary_response.text.strip()
+    
+    summary_result = _parse_llm_json(summary_text)
+    
+    print(f"✓ Session summary generated\n")
+    
+    return SessionSummary(
+        total_shots=total,
+        shots_made=makes,
+        shots_missed=misses,
+        shooting_percentage=shooting_pct,
+        average_form_rating=avg_rating,
+        session_feedback=summary_result.get("session_feedback", ""),
+        drill_suggestions=summary_result.get("drill_suggestions", []),
+        shots=analyzed_shots
+    )
+
+def _check_available():
+    if not MODULES_AVAILABLE:
+        raise HTTPException(status_code=503, detail="Analysis modules not available")
+    
+    if not GEMINI_API_KEY:
+        raise HTTPException(status_code=503, detail="GEMINI_API_KEY not configured")
+
+@asynccontextmanager
+async def _admit_analysis():
+    """
+    Hold a place in the analysis queue, rejecting with 429 when it's full.
+    
+    Each scan holds a temp copy of the upload, decoded frames and pose
+    detectors, so only MAX_CONCURRENT_ANALYSES run at once (see _ANALYZE_SEM)
+    and at most MAX_QUEUED_ANALYSES more may wait for a turn.
+    """
+    global _pending_analyses
+    
+    if _pending_analyses >= MAX_CONCURRENT_ANALYSES + MAX_QUEUED_ANALYSES:
+        raise HTTPException(status_code=429, detail="Server busy - too many videos in progress, try again shortly")
+    
+    _pending_analyses += 1
+    try:
+        yield
+    finally:
+        _pending_analyses -= 1
+
+# Analyze entire video with multiple shots
+@app.post("/analyze", response_model=SessionSummary)
+async def analyze_video(
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...),
+    shooting_side: str = "right",
+    player_id: Optional[int] = None
+):
+    """
+    Analyze ALL shots in a video.
+    
+    Returns session summary with:
+    - All detected shots
+    - Makes/misses count
+    - Session-level feedback
+    - Drill suggestions
+    """
+    _check_available()
+    
+    try:
+        async with _admit_analysis():
+            video_path = await _save_upload(file)
+            
+            # Cleanup temp file
+            background_tasks.add_task(os.unlink, video_path)
+            
+            async with _ANALYZE_SEM:
+                detected_shots = await _scan_video(video_path, shooting_side)
         
-        summary_response = model.generate_content(session_prompt)
-        summary_text = summary_response.text.strip()
-        
-        if "```json" in summary_text:
-            summary_text = summary_text.split("```json")[1].split("```")[0]
-        elif "```" in summary_text:
-            summary_text = summary_text.split("```")[1].split("```")[0]
+        # Shots are independent - run the Gemini round-trips concurrently
+        semaphore = asyncio.Semaphore(GEMINI_CONCURRENCY)
         
-        summary_result = json.loads(summary_text)
+        gemini_start = time.perf_counter()
+        analyzed_shots = await asyncio.gather(*[
+            _analyze_shot(shot_event, idx, len(detected_shots), semaphore)
+            for idx, shot_event in enumerate(detected_shots, 1)
+        ])
+        print(f"⏱️  Shot analysis took {time.perf_counter() - gemini_start:.1f}s")
         
-        print(f"✓ Session summary generated\n")
+        stats = _SessionStats(len(analyzed_shots))
+        for i, analysis in enumerate(analyzed_shots):
+            stats.record(i, analysis)
         
         # Return complete session summary
-        return SessionSummary(
-            total_shots=total,
-            shots_made=makes,
-            shots_missed=misses,
-            shooting_percentage=shooting_pct,
-            average_form_rating=avg_rating,
-            session_feedback=summary_result.get("session_feedback", ""),
-            drill_suggestions=summary_result.get("drill_suggestions", []),
-            shots=analyzed_shots
-        )
+        return await _summarize_session(analyzed_shots, stats)
         
     except HTTPException:
         raise
@@ -369,6 +574,71 @@ Focus on:
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
+# Same analysis, streamed as NDJSON while shots finish
+@app.post("/analyze/stream")
+async def analyze_video_stream(
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...),
+    shooting_side: str = "right"
+):
+    """
+    Analyze ALL shots in a video, streaming one JSON object per line:
+    
+    - {"type": "meta", "total": N} once shots are detected
+    - {"type": "shot", ...ShotAnalysis} as each shot finishes (any order)
+    - {"type": "summary", ...SessionSummary without "shots"} at the end
+    - {"type": "error", "detail": ...} if analysis fails mid-stream
+    
+    Upload and shot-detection errors (and 429 when busy) are returned as
+    normal HTTP errors.
+    """
+    _check_available()
+    
+    try:
+        async with _admit_analysis():
+            video_path = await _save_upload(file)
+            background_tasks.add_task(os.unlink, video_path)
+            
+            async with _ANALYZE_SEM:
+                detected_shots = await _scan_video(video_path, shooting_side)
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"❌ Analysis error: {e}")
+        raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
+    
+    async def gen():
+        total = len(detected_shots)
+        yield _json_line({"type": "meta", "total": total})
+        
+        semaphore = asyncio.Semaphore(GEMINI_CONCURRENCY)
+        tasks = [
+            asyncio.ensure_future(_analyze_shot(shot_event, idx, total, semaphore))
+            for idx, shot_event in enumerate(detected_shots, 1)
+        ]
+        try:
+            stats = _SessionStats(total)
+            analyzed_shots = []
+            
+            for next_done in asyncio.as_completed(tasks):
+                analysis = await next_done
+                stats.record(analysis.shot_number - 1, analysis)
+                analyzed_shots.append(analysis)
+                yield _json_line({"type": "shot", **analysis.model_dump()})
+            
+            summary = await _summarize_session(analyzed_shots, stats)
+            yield _json_line({"type": "summary", **summary.model_dump(exclude={"shots"})})
+        except Exception as e:
+            print(f"❌ Analysis error: {e}")
+            yield _json_line({"type": "error", "detail": f"Analysis failed: {str(e)}"})
+        finally:
+            # A failed shot or a disconnected client ends the stream - don't
+            # keep queueing Gemini calls for it
+            for task in tasks:
+                task.cancel()
+    
+    return StreamingResponse(gen(), media_type="application/x-ndjson")
+
 # Root endpoint
 @app.get("/")
 async def root():